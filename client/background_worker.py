@@ -255,11 +255,13 @@ class NetworkWorker(QThread):
         """
         try:
             # Persist all config to DB atomically (visible immediately to all threads)
-            db_helpers.set_setting('server_url', new_config.server_url or '')
-            db_helpers.set_setting('api_key', new_config.api_key or '')
-            db_helpers.set_setting('device_id', new_config.device_id or '')
-            db_helpers.set_setting('sync_interval', str(new_config.sync_interval))
-            db_helpers.set_setting('timeout', str(new_config.timeout))
+            db_helpers.set_settings({
+                'server_url': new_config.server_url or '',
+                'api_key': new_config.api_key or '',
+                'device_id': new_config.device_id or '',
+                'sync_interval': str(new_config.sync_interval),
+                'timeout': str(new_config.timeout),
+            })
 
             # Update in-memory sync service if it exists
             if self.sync_service:
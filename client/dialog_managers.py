@@ -4,16 +4,22 @@ This module contains dialog managers that handle complex UI interactions
 previously embedded in the main GUI application.
 """
 
-from datetime import datetime
+from pathlib import Path
 
-from PyQt6.QtWidgets import (QDialog, QHBoxLayout, QLabel,
-                             QMessageBox, QPushButton, QTableWidget,
-                             QTableWidgetItem, QVBoxLayout)
+from PyQt6.QtCore import (QAbstractTableModel, QModelIndex, QObject,
+                          QRunnable, QThreadPool, Qt, pyqtSignal)
+from PyQt6.QtWidgets import (QAbstractItemView, QDialog, QHBoxLayout, QLabel,
+                             QMessageBox, QPushButton, QTableView,
+                             QVBoxLayout)
 
 from ui.dialogs.shared import DateRangeDialog
 from ui.dialogs.client import EmployeeListDialog
 from ui.fonts import fonts
 
+# Resolved once at import; Path.resolve() stats the filesystem on every call
+_MODULE_DIR = Path(__file__).resolve().parent
+_DEFAULT_REPORTS_DIR = _MODULE_DIR.parent / 'reports'
+
 
 class EmployeeListManager:
     """Manager for the employee list dialog and operations."""
@@ -32,6 +38,37 @@ class EmployeeListManager:
         dlg.exec()
 
 
+class TimeLogTableModel(QAbstractTableModel):
+    """Read-only model over (badge, name, clock_in, clock_out) row tuples.
+
+    Cells are served lazily from the row list via data(), so the viewer
+    allocates no per-cell item objects no matter how many logs load.
+    """
+
+    HEADERS = ('ID', 'Name', 'Clock In', 'Clock Out')
+
+    def __init__(self, rows, parent=None):
+        super().__init__(parent)
+        self._rows = rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class TimeLogsManager:
     """Manager for time logs viewing dialog."""
 
@@ -46,24 +83,15 @@ class TimeLogsManager:
         """
         dlg = DateRangeDialog(parent)
         if dlg.exec() == QDialog.DialogCode.Accepted:
+            # MM-dd-yyyy strings for display; ISO for the query — SQLite's
+            # date() returns NULL for the display format
             start_date, end_date = dlg.get_dates()
+            iso_start, iso_end = dlg.get_iso_dates()
 
             try:
-                # Get logs for the selected date range
-                logs = []
-                all_logs = client.get_all_time_logs()
-
-                # Filter logs by date range if we have logs
-                for log in all_logs:
-                    if log.clock_in:
-                        # Parse the date from clock_in timestamp
-                        try:
-                            log_date = datetime.fromisoformat(log.clock_in.replace('Z', '+00:00')).date()
-                            if start_date <= log_date <= end_date:
-                                logs.append(log)
-                        except:
-                            # If we can't parse the date, include it anyway
-                            logs.append(log)
+                # Ranged query: the date filter runs in SQLite instead of
+                # fetching every log and re-parsing clock_in in Python
+                logs = client.get_logs_between(iso_start, iso_end)
 
                 if not logs:
                     QMessageBox.information(parent, 'Time Logs',
@@ -84,35 +112,25 @@ class TimeLogsManager:
                 layout.addWidget(title)
                 layout.addWidget(sub_title)
 
-                # Create table
-                table = QTableWidget()
-                table.setColumnCount(4)
-                table.setHorizontalHeaderLabels(['ID', 'Name', 'Clock In', 'Clock Out'])
-                table.setRowCount(len(logs))
+                # Resolve badge -> name once for the whole batch
+                names = {emp.badge: emp.name for emp in client.get_all_employees()}
+
+                rows = [(log.badge,
+                         names.get(log.badge, log.badge),
+                         log.clock_in if log.clock_in else 'N/A',
+                         log.clock_out if log.clock_out else 'Still clocked in')
+                        for log in logs]
+
+                # Model-based view: cells are produced on demand while
+                # painting, with no per-cell item objects
+                table = QTableView()
+                table.setModel(TimeLogTableModel(rows, table))
                 table.setColumnWidth(0, 40)
                 table.setColumnWidth(1, 80)
                 table.setColumnWidth(2, 120)
                 table.setColumnWidth(3, 120)
-
-                for row, log in enumerate(logs):
-                    # ID
-                    table.setItem(row, 0, QTableWidgetItem(log.badge))
-
-                    # Name (Badge)
-                    employee = client.get_employee_by_badge(log.badge)
-                    name = employee.name if employee else log.badge
-                    table.setItem(row, 1, QTableWidgetItem(name))
-
-                    # Clock In
-                    clock_in_text = log.clock_in if log.clock_in else 'N/A'
-                    table.setItem(row, 2, QTableWidgetItem(clock_in_text))
-
-                    # Clock Out
-                    clock_out_text = log.clock_out if log.clock_out else 'Still clocked in'
-                    table.setItem(row, 3, QTableWidgetItem(clock_out_text))
-
                 # Make table read-only
-                table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+                table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
                 layout.addWidget(table)
 
@@ -127,6 +145,35 @@ class TimeLogsManager:
                 QMessageBox.critical(parent, 'Error', f'Failed to retrieve logs: {str(e)}')
 
 
+class _PdfJobSignals(QObject):
+    """Signals for _PdfJob (QRunnable can't carry signals itself)"""
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class _PdfJob(QRunnable):
+    """Render a paystub PDF on a pool thread.
+
+    reportlab rendering and the file write happen off the GUI thread;
+    the preview dialog is opened from the finished signal back on it.
+    """
+
+    def __init__(self, filename, lines, receipt_size):
+        super().__init__()
+        self.signals = _PdfJobSignals()
+        self._filename = filename
+        self._lines = lines
+        self._receipt_size = receipt_size
+
+    def run(self):
+        try:
+            from ui.pdf_utils import generate_paystub_pdf
+            generate_paystub_pdf(self._filename, self._lines, self._receipt_size)
+            self.signals.finished.emit(str(self._filename))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
 class ReportManager:
     """Manager for report generation dialogs."""
 
@@ -139,14 +186,12 @@ class ReportManager:
             parent: Parent widget for dialogs
             client: BigTime client instance for data operations
         """
-        from collections import defaultdict
         from datetime import date, datetime as dt, timedelta
-        from pathlib import Path
 
         from PyQt6.QtWidgets import QInputDialog
 
         from shared.utils import get_data_path
-        from ui.pdf_utils import generate_paystub_pdf
+        from ui.pdf_utils import paystub_height
 
         # Get report type from user
         report_types = ['Daily', 'Weekly', 'Monthly', 'Yearly', 'Custom']
@@ -179,7 +224,9 @@ class ReportManager:
             dlg = DateRangeDialog(parent)
             if dlg.exec() != QDialog.DialogCode.Accepted:
                 return
-            start_date, end_date = dlg.get_dates()
+            # ISO, like the other report types: the strptime and ranged
+            # queries below all expect YYYY-MM-DD
+            start_date, end_date = dlg.get_iso_dates()
 
         try:
             # Get employee details
@@ -193,45 +240,23 @@ class ReportManager:
             period = employee.period
             overtime_multiplier = 1.5
 
-            # Get logs for the date range
-            all_logs = client.get_all_time_logs()
-            logs_for_period = []
-
-            for log in all_logs:
-                if log.badge == badge and log.clock_in:
-                    try:
-                        log_date = dt.fromisoformat(log.clock_in.replace('Z', '+00:00')).date()
-                        start_date_obj = dt.strptime(start_date, '%Y-%m-%d').date()
-                        end_date_obj = dt.strptime(end_date, '%Y-%m-%d').date()
-                        if start_date_obj <= log_date <= end_date_obj:
-                            logs_for_period.append(log)
-                    except:
-                        continue
+            # Get logs for the date range via a ranged, indexed query
+            start_date_obj = dt.strptime(start_date, '%Y-%m-%d').date()
+            end_date_obj = dt.strptime(end_date, '%Y-%m-%d').date()
+            logs_for_period = client.get_logs_for_range(badge, start_date_obj, end_date_obj)
 
             if not logs_for_period:
                 QMessageBox.information(parent, 'No Data',
                                       f'No time logs found for employee {badge} in the selected period ({start_date} to {end_date})')
                 return
 
-            # Calculate hours worked
-            week_hours = defaultdict(float)
-            for log in logs_for_period:
-                clock_in = log.clock_in
-                clock_out = log.clock_out
-
-                if clock_in and clock_out:
-                    try:
-                        t1 = dt.strptime(clock_in, '%Y-%m-%d %H:%M:%S')
-                        t2 = dt.strptime(clock_out, '%Y-%m-%d %H:%M:%S')
-                        hours = (t2 - t1).total_seconds() / 3600.0
-                        year, week, _ = t1.isocalendar()
-                        week_hours[(year, week)] += hours
-                    except:
-                        continue
+            # Hours worked, grouped per week inside SQLite; Python only
+            # sees one row per week instead of parsing every log
+            week_hours = client.get_weekly_hours(badge, start_date, end_date)
 
             total_regular = 0.0
             total_overtime = 0.0
-            for (year, week), hours in week_hours.items():
+            for hours in week_hours.values():
                 if hours > 40:
                     total_regular += 40
                     total_overtime += hours - 40
@@ -261,166 +286,185 @@ class ReportManager:
             overtime_pay = total_overtime * rate * overtime_multiplier
             total_pay = (gross_pay + overtime_pay) if period == 'hourly' else gross_pay
 
-            # Build report lines
+            # Build report lines as a generator streamed straight into
+            # the renderer, so the list is never materialized
             now = dt.now()
-            lines = [
-                ('center', 'SCR Studio Paystub'),
-                ('left', f'Report Type: {report_type}'),
-                ('left', f'Date: {now.strftime("%Y-%m-%d")}'),
-                ('left', f'Employee: {emp_name} (Badge: {badge})')
-            ]
-
-            if report_type != 'Daily':
-                lines.append(('left', f'Period: {start_date} to {end_date}'))
-
-            lines.append(('left', f'Hours Worked: {total_hours:.2f}'))
-            lines.append(('left', f'Rate: ${rate:.2f}/{"hr" if period == "hourly" else "mo"}'))
-            lines.append(('left', f'Gross Pay: ${gross_pay:.2f}'))
-
-            if total_overtime > 0 and period == 'hourly':
-                lines.append(('left', f'Overtime: {total_overtime:.2f} hrs @ ${rate * overtime_multiplier:.2f}/hr'))
-                lines.append(('left', f'Overtime Pay: ${overtime_pay:.2f}'))
-
-            lines.append(('left', f'Total Pay: ${total_pay:.2f}'))
-            lines.append(('left', 'Thank you!'))
-
-            # Calculate PDF size
-            line_height = 20
-            total_height = 30
-            for _, text in lines:
-                total_height += line_height
-                if text.startswith('Date:'):
-                    total_height += 10
-                if text.startswith('Total Pay:'):
-                    total_height += 20
-
-            receipt_size = (216, total_height)
+            show_period = report_type != 'Daily'
+            show_overtime = total_overtime > 0 and period == 'hourly'
+
+            def _build_lines():
+                yield ('center', 'SCR Studio Paystub')
+                yield ('left', f'Report Type: {report_type}')
+                yield ('left', f'Date: {now.strftime("%Y-%m-%d")}')
+                yield ('left', f'Employee: {emp_name} (Badge: {badge})')
+
+                if show_period:
+                    yield ('left', f'Period: {start_date} to {end_date}')
+
+                yield ('left', f'Hours Worked: {total_hours:.2f}')
+                yield ('left', f'Rate: ${rate:.2f}/{"hr" if period == "hourly" else "mo"}')
+                yield ('left', f'Gross Pay: ${gross_pay:.2f}')
+
+                if show_overtime:
+                    yield ('left', f'Overtime: {total_overtime:.2f} hrs @ ${rate * overtime_multiplier:.2f}/hr')
+                    yield ('left', f'Overtime Pay: ${overtime_pay:.2f}')
+
+                yield ('left', f'Total Pay: ${total_pay:.2f}')
+                yield ('left', 'Thank you!')
+
+            # Receipt height from the shared layout formula; the line
+            # count follows from the two conditionals above
+            num_lines = 9 + (1 if show_period else 0) + (2 if show_overtime else 0)
+            receipt_size = (216, paystub_height(num_lines))
 
             # Create output directory
             base_dir = Path(client.get_setting('report_save_path', str(get_data_path("reports"))))
             if not base_dir:
-                base_dir = Path(__file__).resolve().parent.parent / 'reports'
+                base_dir = _DEFAULT_REPORTS_DIR
 
             emp_folder = base_dir / str(badge)
             emp_folder.mkdir(parents=True, exist_ok=True)
 
-            # Generate PDF
+            # Generate PDF on a pool thread so the window keeps painting
+            # during the reportlab render, then preview from the signal
             filename = emp_folder / f"paystub_{badge}_{report_type}_{now.strftime('%Y%m%d_%H%M%S')}.pdf"
-            generate_paystub_pdf(filename, lines, receipt_size)
+            pdf_height = round(receipt_size[1] * 1.5)
 
-            # Display PDF preview
-            pdf_path = str(filename)
-            try:
-                from PyQt6.QtPdf import QPdfDocument
-                from PyQt6.QtPdfWidgets import QPdfView
-
-                class PdfDialog(QDialog):
-                    """Dialog for displaying and interacting with PDF documents."""
-
-                    def __init__(self, pdf_path: str, pdf_height: int, parent=None):
-                        """
-                        Initialize the PDF preview dialog.
-
-                        Args:
-                            pdf_path: Path to the PDF file
-                            pdf_height: Height of the PDF for sizing the dialog
-                            parent: Parent widget
-                        """
-                        super().__init__(parent)
-                        self.setWindowTitle('Paystub Preview')
-                        h = max(400, min(pdf_height, 800))
-                        self.resize(360, h)
-
-                        layout = QVBoxLayout(self)
-
-                        self.pdf_view = QPdfView(parent)
-                        self.pdf_doc = QPdfDocument(parent)
-                        self.pdf_doc.load(pdf_path)
-                        self.pdf_view.setDocument(self.pdf_doc)
-                        layout.addWidget(self.pdf_view)
-
-                        # Button row: Print, Open File, Close
-                        btn_row = QHBoxLayout()
-                        print_btn = QPushButton('Print')
-                        open_btn = QPushButton('Open File')
-                        close_btn = QPushButton('Close')
-
-                        btn_row.addWidget(print_btn)
-                        btn_row.addWidget(open_btn)
-                        btn_row.addStretch()
-                        btn_row.addWidget(close_btn)
-
-                        layout.addLayout(btn_row)
-
-                        # Handlers use OS-level open/print where available
-                        def _do_print():
-                            try:
-                                from PyQt6.QtGui import QPainter
-                                from PyQt6.QtPrintSupport import (
-                                    QPrintDialog,
-                                    QPrinter,
-                                )
-
-                                printer = QPrinter()
-                                dlg = QPrintDialog(printer, self)
-                                if dlg.exec() == QDialog.DialogCode.Accepted:
-                                    painter = QPainter()
-                                    if not painter.begin(printer):
-                                        raise RuntimeError('Could not begin QPainter on printer')
-                                    try:
-                                        self.pdf_view.render(painter)
-                                    finally:
-                                        painter.end()
-                            except Exception as e:
-                                QMessageBox.warning(self, 'Print Error', f'Could not print file: {e}')
-
-                        def _open_file():
-                            try:
-                                import os
-                                import subprocess
-                                import sys
-
-                                p = str(pdf_path)
-
-                                # Reveal in file manager: select on Windows/Finder, open folder on Linux
-                                if sys.platform.startswith('win'):
-                                    # explorer /select,"path"
-                                    subprocess.run(['explorer', '/select,', p])
-                                elif sys.platform == 'darwin':
-                                    subprocess.run(['open', '-R', p])
-                                else:
-                                    # On Linux open the containing folder
-                                    subprocess.run(['xdg-open', os.path.dirname(p)])
-                            except Exception as e:
-                                QMessageBox.warning(self, 'Open Error', f'Could not reveal file: {e}')
-
-                        print_btn.clicked.connect(_do_print)
-                        open_btn.clicked.connect(_open_file)
-                        close_btn.clicked.connect(self.accept)
-
-                dlg = PdfDialog(pdf_path, round(receipt_size[1] * 1.5), parent)
-                dlg.exec()
+            def _on_pdf_ready(pdf_path):
+                ReportManager._pdf_job = None
+                ReportManager._show_pdf_preview(parent, pdf_path, pdf_height)
 
-            except Exception as e:
-                import os
-                import subprocess
-                import sys
-                import traceback
+            def _on_pdf_failed(message):
+                ReportManager._pdf_job = None
+                QMessageBox.critical(parent, 'Report Error',
+                                     f'Failed to generate report: {message}')
 
-                print("[PDF VIEWER ERROR]", e)
-                print(traceback.format_exc())
+            job = _PdfJob(filename, _build_lines(), receipt_size)
+            queued = Qt.ConnectionType.QueuedConnection
+            job.signals.finished.connect(_on_pdf_ready, queued)
+            job.signals.failed.connect(_on_pdf_failed, queued)
 
-                try:
-                    import webbrowser
-                    webbrowser.open_new(pdf_path)
-                except Exception as e2:
-                    print("[BROWSER ERROR]", e2)
-                    try:
-                        os.startfile(pdf_path)
-                    except Exception as e3:
-                        print("[STARTFILE ERROR]", e3)
-                        QMessageBox.warning(parent, 'Open PDF', f'Could not open PDF automatically. Please open manually: {pdf_path}\nError: {e}')
+            # Keep the job referenced until its signal lands
+            ReportManager._pdf_job = job
+            QThreadPool.globalInstance().start(job)
 
         except Exception as e:
             import traceback
             QMessageBox.critical(parent, 'Report Error', f'Failed to generate report: {str(e)}\n{traceback.format_exc()}')
+
+    _pdf_job = None
+
+    @staticmethod
+    def _show_pdf_preview(parent, pdf_path: str, pdf_height: int):
+        """Open the paystub preview dialog for a rendered PDF file."""
+        try:
+            from PyQt6.QtPdf import QPdfDocument
+            from PyQt6.QtPdfWidgets import QPdfView
+
+            class PdfDialog(QDialog):
+                """Dialog for displaying and interacting with PDF documents."""
+
+                def __init__(self, pdf_path: str, pdf_height: int, parent=None):
+                    """
+                    Initialize the PDF preview dialog.
+
+                    Args:
+                        pdf_path: Path to the PDF file
+                        pdf_height: Height of the PDF for sizing the dialog
+                        parent: Parent widget
+                    """
+                    super().__init__(parent)
+                    self.setWindowTitle('Paystub Preview')
+                    h = max(400, min(pdf_height, 800))
+                    self.resize(360, h)
+
+                    layout = QVBoxLayout(self)
+
+                    self.pdf_view = QPdfView(parent)
+                    self.pdf_doc = QPdfDocument(parent)
+                    self.pdf_doc.load(pdf_path)
+                    self.pdf_view.setDocument(self.pdf_doc)
+                    layout.addWidget(self.pdf_view)
+
+                    # Button row: Print, Open File, Close
+                    btn_row = QHBoxLayout()
+                    print_btn = QPushButton('Print')
+                    open_btn = QPushButton('Open File')
+                    close_btn = QPushButton('Close')
+
+                    btn_row.addWidget(print_btn)
+                    btn_row.addWidget(open_btn)
+                    btn_row.addStretch()
+                    btn_row.addWidget(close_btn)
+
+                    layout.addLayout(btn_row)
+
+                    # Handlers use OS-level open/print where available
+                    def _do_print():
+                        try:
+                            from PyQt6.QtGui import QPainter
+                            from PyQt6.QtPrintSupport import (
+                                QPrintDialog,
+                                QPrinter,
+                            )
+
+                            printer = QPrinter()
+                            dlg = QPrintDialog(printer, self)
+                            if dlg.exec() == QDialog.DialogCode.Accepted:
+                                painter = QPainter()
+                                if not painter.begin(printer):
+                                    raise RuntimeError('Could not begin QPainter on printer')
+                                try:
+                                    self.pdf_view.render(painter)
+                                finally:
+                                    painter.end()
+                        except Exception as e:
+                            QMessageBox.warning(self, 'Print Error', f'Could not print file: {e}')
+
+                    def _open_file():
+                        try:
+                            import os
+                            import subprocess
+                            import sys
+
+                            p = str(pdf_path)
+
+                            # Reveal in file manager: select on Windows/Finder, open folder on Linux
+                            if sys.platform.startswith('win'):
+                                # explorer /select,"path"
+                                subprocess.run(['explorer', '/select,', p])
+                            elif sys.platform == 'darwin':
+                                subprocess.run(['open', '-R', p])
+                            else:
+                                # On Linux open the containing folder
+                                subprocess.run(['xdg-open', os.path.dirname(p)])
+                        except Exception as e:
+                            QMessageBox.warning(self, 'Open Error', f'Could not reveal file: {e}')
+
+                    print_btn.clicked.connect(_do_print)
+                    open_btn.clicked.connect(_open_file)
+                    close_btn.clicked.connect(self.accept)
+
+            dlg = PdfDialog(pdf_path, pdf_height, parent)
+            dlg.exec()
+
+        except Exception as e:
+            import os
+            import subprocess
+            import sys
+            import traceback
+
+            print("[PDF VIEWER ERROR]", e)
+            print(traceback.format_exc())
+
+            try:
+                import webbrowser
+                webbrowser.open_new(pdf_path)
+            except Exception as e2:
+                print("[BROWSER ERROR]", e2)
+                try:
+                    os.startfile(pdf_path)
+                except Exception as e3:
+                    print("[STARTFILE ERROR]", e3)
+                    QMessageBox.warning(parent, 'Open PDF', f'Could not open PDF automatically. Please open manually: {pdf_path}\nError: {e}')
+
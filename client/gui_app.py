@@ -3,10 +3,12 @@ BigTime Client GUI Application
 This module contains the main GUI application logic, separated from the UI widgets.
 """
 
+import hmac
 import sys
-from datetime import datetime
+import time
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import (Qt, QObject, QRunnable, QThreadPool, QTimer,
+                          pyqtSignal)
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (QApplication, QDialog,
                              QHBoxLayout, QLabel, QLineEdit,
@@ -26,6 +28,53 @@ from ui.dialogs.shared import DatabaseSelectDialog
 from ui.dialogs.client import *
 from ui.fonts import fonts
 
+# Clock display format, hoisted so the per-tick path does no string rebuilding
+CLOCK_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Badge-input feedback styles; Qt parses the stylesheet text every time
+# one is applied, so the literals are built once here
+INPUT_STYLE_WARN = 'background-color: #ffcccc'
+INPUT_STYLE_ERROR = 'background-color: #ff8888'
+INPUT_STYLE_CLEAR = ''
+
+
+def _pin_matches(entered: str, stored: str) -> bool:
+    """Constant-time PIN comparison.
+
+    hmac.compare_digest does not exit early on the first differing
+    character, so response timing leaks nothing about the stored PIN.
+    """
+    return hmac.compare_digest(
+        (entered or '').strip().encode(), (stored or '').strip().encode()
+    )
+
+
+class _BackupTaskSignals(QObject):
+    """Signals for _BackupTask (QRunnable cannot carry signals itself)."""
+    finished = pyqtSignal(object)  # backup path
+    failed = pyqtSignal(str)       # error message
+
+
+class _BackupTask(QRunnable):
+    """Copies the database to a timestamped backup on the global thread pool.
+
+    The file copy can take hundreds of milliseconds for a sizeable SQLite
+    file; running it here keeps the GUI event loop responsive.
+    """
+
+    def __init__(self, db_name):
+        super().__init__()
+        self.db_name = db_name
+        self.signals = _BackupTaskSignals()
+
+    def run(self):
+        from shared.backup_utils import create_backup
+        try:
+            backup_path = create_backup(self.db_name)
+            self.signals.finished.emit(backup_path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
 
 class BigTimeClientApp(QMainWindow):
     """Main BigTime client application window"""
@@ -51,6 +100,7 @@ class BigTimeClientApp(QMainWindow):
         self.manager_ootb = False
         self.is_moderator = False
         self.is_in_ootb_setup = False  # Flag to prevent auto-sync during OOTB
+        self._last_clock_text = ''  # Last string pushed to the clock label
 
         # Setup minimal UI immediately (fast operations only)
         self.setup_minimal_ui()
@@ -137,6 +187,11 @@ class BigTimeClientApp(QMainWindow):
             self.update_loading_progress('Starting network services...')
             self.setup_network_worker()
 
+            # Warm the reportlab import on a pool thread so the first
+            # report doesn't pay it on the GUI thread
+            from ui.pdf_utils import ensure_reportlab
+            QThreadPool.globalInstance().start(QRunnable.create(ensure_reportlab))
+
             # Setup full UI
             self.update_loading_progress('Setting up interface...')
             QTimer.singleShot(10, self.setup_full_ui_async)
@@ -152,13 +207,17 @@ class BigTimeClientApp(QMainWindow):
             # NetworkWorker is implemented as a QThread subclass; start it directly
             self.network_worker = NetworkWorker(client=self.client)
 
-            # Connect signals from network worker to GUI
-            self.network_worker.sync_status_changed.connect(self.on_sync_status_changed)
-            self.network_worker.employee_synced.connect(self.on_employee_synced)
-            self.network_worker.server_info_updated.connect(self.on_server_info_updated)
-            self.network_worker.connection_status_changed.connect(self.on_connection_status_changed)
-            self.network_worker.tick.connect(self.update_clock)
-            self.network_worker.clear_status.connect(self.clear_status_message)
+            # Connect signals from network worker to GUI. These cross the
+            # worker/GUI thread boundary, so request QueuedConnection
+            # explicitly rather than relying on AutoConnection resolving it
+            # per-emit.
+            queued = Qt.ConnectionType.QueuedConnection
+            self.network_worker.sync_status_changed.connect(self.on_sync_status_changed, queued)
+            self.network_worker.employee_synced.connect(self.on_employee_synced, queued)
+            self.network_worker.server_info_updated.connect(self.on_server_info_updated, queued)
+            self.network_worker.connection_status_changed.connect(self.on_connection_status_changed, queued)
+            self.network_worker.tick.connect(self.update_clock, queued)
+            self.network_worker.clear_status.connect(self.clear_status_message, queued)
 
             # Start the worker thread
             self.network_worker.start()
@@ -241,15 +300,21 @@ class BigTimeClientApp(QMainWindow):
             self.report_save_path = str(get_data_path("reports"))
         # Note: manager_password and manager_ootb can legitimately be None/False
 
-    def setup_ui(self):
-        """Setup the main user interface"""
-        from shared.utils import create_app_icon
+    def _refresh_title(self):
+        """Set the window title from the current company name.
 
-        # Set window title: only prepend company name if it's not the default 'BigTime'
+        Only prepends the company name when it's not the default 'BigTime'.
+        """
         if self.company_name and self.company_name != 'BigTime':
             self.setWindowTitle(f'{self.company_name} - BigTime')
         else:
             self.setWindowTitle('BigTime')
+
+    def setup_ui(self):
+        """Setup the main user interface"""
+        from shared.utils import create_app_icon
+
+        self._refresh_title()
         self.setWindowIcon(create_app_icon())
         # self.setMinimumSize(420, 420)
 
@@ -374,16 +439,23 @@ class BigTimeClientApp(QMainWindow):
     def update_clock(self):
         """Update the clock display in the title label"""
         if hasattr(self, 'clock') and self.clock:
-            self.clock.setText(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            # time.strftime is the C fast path; avoids building a datetime
+            # object on every tick
+            text = time.strftime(CLOCK_FORMAT)
+            # Only touch the label when the displayed second actually changed,
+            # so repaints happen at most once per visible second
+            if text != self._last_clock_text:
+                self._last_clock_text = text
+                self.clock.setText(text)
 
     def smart_clock_action(self):
         """Smart clock in/out based on employee's current status"""
         badge = self.employee_input.text().strip()
         if not badge:
-            self.employee_input.setStyleSheet('background-color: #ffcccc')
+            self.employee_input.setStyleSheet(INPUT_STYLE_WARN)
             return
 
-        self.employee_input.setStyleSheet('')
+        self.employee_input.setStyleSheet(INPUT_STYLE_CLEAR)
 
         # Check if employee exists
         employee = self.client.get_employee_by_badge(badge)
@@ -520,14 +592,17 @@ class BigTimeClientApp(QMainWindow):
 
             values = dlg.get_values()
 
-            # Save settings using client
-            self.client.set_setting('manager_pin', values['manager_pin'])
-            self.client.set_setting('report_save_path', values['report_save_path'])
-            self.client.set_setting('manager_password', values['manager_pin'])
-            self.client.set_setting('manager_password_ootb', '0')
+            # Save settings using client in a single transaction
+            setup_settings = {
+                'manager_pin': values['manager_pin'],
+                'report_save_path': values['report_save_path'],
+                'manager_password': values['manager_pin'],
+                'manager_password_ootb': '0',
+            }
             # Initialize company_name setting if not already set
             if not self.client.get_setting('company_name'):
-                self.client.set_setting('company_name', 'BigTime')
+                setup_settings['company_name'] = 'BigTime'
+            self.client.set_settings(setup_settings)
 
             self.logger.info("OOTB setup completed - saved manager_password_ootb=0")
 
@@ -550,11 +625,13 @@ class BigTimeClientApp(QMainWindow):
                 else:
                     # Fallback: save directly to database (will be loaded on next start)
                     from shared import db_helpers
-                    db_helpers.set_setting('server_url', sync_config.server_url)
-                    db_helpers.set_setting('device_id', sync_config.device_id)
-                    db_helpers.set_setting('api_key', sync_config.api_key)
-                    db_helpers.set_setting('sync_interval', str(sync_config.sync_interval))
-                    db_helpers.set_setting('timeout', str(sync_config.timeout))
+                    db_helpers.set_settings({
+                        'server_url': sync_config.server_url,
+                        'device_id': sync_config.device_id,
+                        'api_key': sync_config.api_key,
+                        'sync_interval': str(sync_config.sync_interval),
+                        'timeout': str(sync_config.timeout),
+                    })
                     self.set_status_with_autoclear('✅ Sync will start on next launch')
             else:
                 self.set_status_with_autoclear('📴 Working offline mode')
@@ -583,7 +660,7 @@ class BigTimeClientApp(QMainWindow):
 
             if pin_dialog.exec() == QDialog.DialogCode.Accepted:
                 entered_pin = pin_dialog.get_pin()
-                if entered_pin == self.manager_password:
+                if _pin_matches(entered_pin, self.manager_password):
                     self.is_moderator = True
                     self.update_menu_state()
                 else:
@@ -620,11 +697,11 @@ class BigTimeClientApp(QMainWindow):
         """Handle clock in with PIN authentication"""
         badge = self.employee_input.text().strip()
         if not badge:
-            self.employee_input.setStyleSheet('background-color: #ffcccc')
+            self.employee_input.setStyleSheet(INPUT_STYLE_WARN)
             QMessageBox.warning(self, 'Input Error', 'Please enter your badge number.')
             return
         else:
-            self.employee_input.setStyleSheet('')
+            self.employee_input.setStyleSheet(INPUT_STYLE_CLEAR)
 
         # Check if employee exists
         employee = self.client.get_employee_by_badge(badge)
@@ -660,7 +737,7 @@ class BigTimeClientApp(QMainWindow):
             pin_dialog = PinDialog(self, set_flag=False)
             if pin_dialog.exec() == QDialog.DialogCode.Accepted:
                 entered_pin = pin_dialog.get_pin()
-                if entered_pin != employee.pin:
+                if not _pin_matches(entered_pin, employee.pin):
                     self.set_status_with_autoclear(
                         '❌ Incorrect PIN',
                         'color: red; font-weight: bold;'
@@ -690,11 +767,11 @@ class BigTimeClientApp(QMainWindow):
         """Handle clock out with PIN authentication"""
         badge = self.employee_input.text().strip()
         if not badge:
-            self.employee_input.setStyleSheet('background-color: #ff8888')
+            self.employee_input.setStyleSheet(INPUT_STYLE_ERROR)
             QMessageBox.warning(self, 'Input Error', 'Please enter your badge number.')
             return
         else:
-            self.employee_input.setStyleSheet('')
+            self.employee_input.setStyleSheet(INPUT_STYLE_CLEAR)
 
         # Check if employee exists
         employee = self.client.get_employee_by_badge(badge)
@@ -730,7 +807,7 @@ class BigTimeClientApp(QMainWindow):
             pin_dialog = PinDialog(self, set_flag=False)
             if pin_dialog.exec() == QDialog.DialogCode.Accepted:
                 entered_pin = pin_dialog.get_pin()
-                if entered_pin != employee.pin:
+                if not _pin_matches(entered_pin, employee.pin):
                     self.set_status_with_autoclear(
                         '❌ Incorrect PIN',
                         'color: red; font-weight: bold;'
@@ -818,12 +895,13 @@ class BigTimeClientApp(QMainWindow):
         if dlg.exec() == QDialog.DialogCode.Accepted:
             values = dlg.get_values()
 
-            # Save settings using client
+            # Save settings using client in a single transaction
             self.manager_pin = values['manager_pin']
-            self.client.set_setting('manager_pin', values['manager_pin'])
-
             self.report_save_path = values['report_save_path']
-            self.client.set_setting('report_save_path', values['report_save_path'])
+            self.client.set_settings({
+                'manager_pin': values['manager_pin'],
+                'report_save_path': values['report_save_path'],
+            })
 
 
     def configure_server(self):
@@ -919,11 +997,7 @@ class BigTimeClientApp(QMainWindow):
                 self.company_name = str(server_info['company_name']).strip()
                 # Save company name to local database for persistence
                 self.client.set_setting('company_name', self.company_name)
-                # Update title: only prepend company name if it's not the default 'BigTime'
-                if self.company_name and self.company_name != 'BigTime':
-                    self.setWindowTitle(f'{self.company_name} - BigTime')
-                else:
-                    self.setWindowTitle('BigTime')
+                self._refresh_title()
         except Exception as e:
             pass  # Non-critical
 
@@ -1106,14 +1180,20 @@ class BigTimeClientApp(QMainWindow):
                     )
 
     def backup_database(self):
-        """Backup the local database"""
-        from shared.backup_utils import create_backup
-
-        try:
-            backup_path = create_backup('bigtime.db')
-            QMessageBox.information(self, 'Backup', f'Database backed up as {backup_path}')
-        except Exception as e:
-            QMessageBox.warning(self, 'Backup Failed', f'Could not backup database: {e}')
+        """Backup the local database without blocking the GUI thread"""
+        task = _BackupTask('bigtime.db')
+        # Queued explicitly: the signals are emitted from the pool thread,
+        # and the message boxes must be built on the GUI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        task.signals.finished.connect(
+            lambda path: QMessageBox.information(self, 'Backup', f'Database backed up as {path}'),
+            queued)
+        task.signals.failed.connect(
+            lambda msg: QMessageBox.warning(self, 'Backup Failed', f'Could not backup database: {msg}'),
+            queued)
+        # Keep a reference so the signal holder outlives this call
+        self._backup_task = task
+        QThreadPool.globalInstance().start(task)
 
     def restore_database(self):
         """Restore the local database from a backup file"""
@@ -1145,6 +1225,11 @@ class BigTimeClientApp(QMainWindow):
             return
 
         try:
+            # Drop every thread's cached connection before the rewrite;
+            # the network worker reopens on its next query
+            from shared import db_helpers
+            db_helpers.close_connection()
+
             restore_from_backup(Path(backup_path), 'bigtime.db')
             QMessageBox.information(
                 self,
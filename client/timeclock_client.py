@@ -168,30 +168,31 @@ class BigTimeClient(QObject):
         Returns: {'success': bool, 'message': str, 'client_id': str}
         """
         try:
-            # Check if employee exists
-            employee = self.get_employee_by_badge(badge)
-            if not employee:
+            now = format_datetime(datetime.now())
+            client_id = str(uuid.uuid4())
+
+            # Single guarded insert: employee check, open-log check, and
+            # insert happen in one transaction (sync handled by NetworkWorker)
+            result = db_helpers.try_open_log(
+                badge, now, client_id, sync_state=SyncState.PENDING.value
+            )
+
+            if result == 'no_emp':
                 return {
                     'success': False,
                     'message': f'Employee with badge {badge} not found',
                     'client_id': None
                 }
 
-            # Check for existing open log (local database)
-            open_log = db_helpers.get_open_log_for_badge(badge)
-            if open_log:
+            if result == 'already_open':
                 return {
                     'success': False,
                     'message': f'Employee {badge} is already clocked in (local)',
                     'client_id': None
                 }
 
-            # Create log entry (local database only - sync handled by NetworkWorker)
-            now = format_datetime(datetime.now())
-            client_id = str(uuid.uuid4())
-
-            # Insert directly to local database with PENDING sync state
-            db_helpers.insert_log(badge, now, client_id, sync_state=SyncState.PENDING.value)
+            # Cached lookup, only needed for the success message
+            employee = self.get_employee_by_badge(badge)
 
             return {
                 'success': True,
@@ -252,6 +253,10 @@ class BigTimeClient(QObject):
         """Get logs for date range"""
         return db_helpers.fetch_logs_for_range(badge, start_date, end_date)
 
+    def get_weekly_hours(self, badge: str, start_date: str, end_date: str) -> dict:
+        """Get completed hours per week for a badge, aggregated in SQL"""
+        return db_helpers.weekly_hours_for_range(badge, start_date, end_date)
+
     # Settings operations
     def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get setting value"""
@@ -261,6 +266,10 @@ class BigTimeClient(QObject):
         """Set setting value"""
         db_helpers.set_setting(key, value)
 
+    def set_settings(self, settings: dict):
+        """Set several settings in one transaction"""
+        db_helpers.set_settings(settings)
+
     # Sync operations
     def get_pending_logs_count(self) -> int:
         """Get count of logs pending sync"""
@@ -275,10 +284,18 @@ class BigTimeClient(QObject):
         """Get all time logs"""
         return db_helpers.get_all_time_logs()
 
+    def get_logs_between(self, start_date, end_date) -> List[TimeLog]:
+        """Get logs for all employees within a date range"""
+        return db_helpers.fetch_logs_between(start_date, end_date)
+
     def update_time_log(self, log_id: int, clock_in: str, clock_out: str):
         """Update time log with new times"""
         return db_helpers.update_time_log(log_id, clock_in, clock_out)
 
+    def update_time_logs(self, updates: List[tuple]) -> int:
+        """Apply several (log_id, clock_in, clock_out) edits in one transaction"""
+        return db_helpers.update_time_logs_bulk(updates)
+
     def delete_time_log(self, log_id: int) -> bool:
         """Delete time log by ID"""
         # Get the remote_id before deleting locally (in case we need it for server sync)
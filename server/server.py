@@ -41,18 +41,29 @@ API_KEYS = {
 }
 
 
+def _apply_connection_pragmas(conn):
+    """Apply shared PRAGMA tuning to a new connection.
+
+    WAL mode lets API reads proceed while a sync write commits;
+    synchronous=NORMAL drops the per-commit fsync to WAL checkpoints,
+    and temp tables stay in memory.
+    """
+    conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+
+
 def get_db():
     """Get database connection (for Flask context).
 
-    Uses traditional rollback journal (not WAL) for simpler concurrency model.
+    Uses WAL journal mode so concurrent reads don't block writes.
     Sets busy timeout for retry on locked database.
     """
     if 'db' not in g:
         g.db = sqlite3.connect(str(SERVER_DB))
         try:
-            g.db.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
-            # Use traditional journal mode for simpler concurrency
-            g.db.execute("PRAGMA journal_mode = DELETE")
+            _apply_connection_pragmas(g.db)
         except Exception as e:
             logger.warning(f"Failed to set PRAGMA options: {e}")
         g.db.row_factory = sqlite3.Row
@@ -62,20 +73,38 @@ def get_db():
 def get_standalone_db():
     """Get standalone database connection (outside Flask context).
 
-    Uses traditional rollback journal (not WAL) for simpler concurrency model.
+    Uses WAL journal mode so concurrent reads don't block writes.
     Sets busy timeout for retry on locked database.
     """
     conn = sqlite3.connect(str(SERVER_DB))
     try:
-        conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
-        # Use traditional journal mode for simpler concurrency
-        conn.execute("PRAGMA journal_mode = DELETE")
+        _apply_connection_pragmas(conn)
     except Exception as e:
         logger.warning(f"Failed to set PRAGMA options: {e}")
     conn.row_factory = sqlite3.Row
     return conn
 
 
+def checkpoint_wal():
+    """Fold the WAL into the main database file.
+
+    The Flask threads hold WAL-mode connections open while the server
+    runs, so committed rows routinely sit in server_bigtime.db-wal
+    between automatic checkpoints. Truncating the WAL at clean shutdown
+    leaves the main file complete on its own for anything that copies
+    it while the server is down. Live backups don't depend on this:
+    shared.backup_utils reads through the sqlite3 backup API.
+    """
+    try:
+        conn = sqlite3.connect(str(SERVER_DB))
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+    except Exception as e:
+        logger.warning(f"WAL checkpoint failed: {e}")
+
+
 def close_db(error):
     """Close database connection"""
     db = g.pop('db', None)
@@ -92,8 +121,7 @@ def init_server_db():
     """Initialize server database and time service"""
     conn = sqlite3.connect(str(SERVER_DB))
     try:
-        conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
-        conn.execute("PRAGMA journal_mode = DELETE")  # Use traditional rollback journal
+        _apply_connection_pragmas(conn)
     except Exception:
         pass
     conn.row_factory = sqlite3.Row
@@ -159,6 +187,13 @@ def init_server_db():
             )
         """)
 
+        # The key management table orders by created_at DESC on every
+        # refresh; an index makes that an ordered scan instead of a sort
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_api_keys_created_at
+            ON api_keys(created_at DESC)
+        """)
+
         # Settings table for server configuration
         conn.execute("""
             CREATE TABLE IF NOT EXISTS settings (
@@ -948,6 +983,7 @@ def run_server(host='0.0.0.0', port=DEFAULT_SERVER_PORT):
             cleanup_interval=WAITRESS_CLEANUP_INTERVAL,
             asyncore_use_poll=True  # Better performance on Windows
         )
+        checkpoint_wal()
         return
 
     global _waitress_server, _waitress_lock
@@ -986,6 +1022,9 @@ def run_server(host='0.0.0.0', port=DEFAULT_SERVER_PORT):
             except Exception as e:
                 logger.warning(f"Failed to stop time service: {e}")
 
+            # Leave the main database file self-contained on disk
+            checkpoint_wal()
+
             # Ensure proper cleanup on exit
             with _waitress_lock:
                 try:
@@ -17,6 +17,16 @@ except ImportError:
     ntplib = None
 
 
+def _format_with_tz(dt: datetime) -> str:
+    """Render '%Y-%m-%d %H:%M:%S %Z' without the per-call strftime.
+
+    strftime re-parses its format string and goes through the C locale
+    machinery each call; direct field formatting skips both.
+    """
+    return (f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d} '
+            f'{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} {dt.tzname() or ""}')
+
+
 class TimeServerService:
     """Manages time synchronization for the BigTime server"""
 
@@ -55,12 +65,33 @@ class TimeServerService:
         self.current_server = None
         self.sync_callbacks = []
 
+        # Set when the sync loop should stop; waiting on the event sleeps
+        # the full interval in one wakeup while staying promptly stoppable
+        self._stop = threading.Event()
+
+        # Resolved once here and again on timezone changes, instead of a
+        # ZoneInfo lookup per sync and per get_current_time call
+        self._tzinfo = self._resolve_timezone(timezone_name)
+
         # Get appropriate servers for timezone
         self.ntp_servers = self.get_servers_for_timezone(timezone_name)
 
+        # One client object reused across syncs instead of a fresh
+        # NTPClient per server per attempt
+        self._ntp_client = ntplib.NTPClient() if ntplib is not None else None
+
         if ntplib is None:
             self.logger.warning("ntplib not available. Time sync disabled.")
 
+    def _resolve_timezone(self, tz_name: str):
+        """Resolve a timezone name, falling back to UTC with a warning"""
+        try:
+            return zoneinfo.ZoneInfo(tz_name)
+        except Exception:
+            if tz_name != 'UTC':
+                self.logger.warning(f"Timezone '{tz_name}' not available, using UTC")
+            return timezone.utc
+
     def get_servers_for_timezone(self, tz_name: str) -> list:
         """Get the best NTP servers for a given timezone"""
         if tz_name in self.TIMEZONE_SERVERS:
@@ -98,8 +129,7 @@ class TimeServerService:
 
         for server in self.ntp_servers:
             try:
-                client = ntplib.NTPClient()
-                response = client.request(server, version=3, timeout=2)
+                response = self._ntp_client.request(server, version=3, timeout=2)
 
                 # Calculate offset from system time
                 ntp_time = response.tx_time
@@ -109,23 +139,14 @@ class TimeServerService:
                 self.current_server = server
                 self.last_sync_time = datetime.now(timezone.utc)
 
-                # Convert to timezone with fallback
-                try:
-                    tz = zoneinfo.ZoneInfo(self.timezone_name)
-                    synced_datetime = datetime.fromtimestamp(ntp_time, tz=tz)
-                except Exception:
-                    # Fallback to UTC if timezone data is missing
-                    tz = timezone.utc
-                    synced_datetime = datetime.fromtimestamp(ntp_time, tz=tz)
-                    if self.timezone_name != 'UTC':
-                        self.logger.warning(f"Timezone '{self.timezone_name}' not available, using UTC")
+                synced_datetime = datetime.fromtimestamp(ntp_time, tz=self._tzinfo)
 
                 result = {
                     'success': True,
                     'server': server,
                     'offset': self.sync_offset,
                     'synced_time': synced_datetime,
-                    'formatted_time': synced_datetime.strftime('%Y-%m-%d %H:%M:%S %Z'),
+                    'formatted_time': _format_with_tz(synced_datetime),
                     'sync_timestamp': self.last_sync_time
                 }
 
@@ -146,19 +167,13 @@ class TimeServerService:
 
     def get_current_time(self) -> datetime:
         """Get current time with NTP correction applied"""
-        try:
-            tz = zoneinfo.ZoneInfo(self.timezone_name)
-        except Exception:
-            # Fallback to UTC if timezone data is missing
-            tz = timezone.utc
-
         if self.sync_offset != 0.0:
             # Apply NTP correction
             corrected_timestamp = time.time() + self.sync_offset
-            return datetime.fromtimestamp(corrected_timestamp, tz=tz)
+            return datetime.fromtimestamp(corrected_timestamp, tz=self._tzinfo)
         else:
             # Fallback to system time
-            return datetime.now(tz)
+            return datetime.now(self._tzinfo)
 
     def start_sync_service(self):
         """Start the background time sync service"""
@@ -166,6 +181,7 @@ class TimeServerService:
             return
 
         self.running = True
+        self._stop.clear()
         self.sync_thread = threading.Thread(target=self._sync_loop, daemon=True)
         self.sync_thread.start()
 
@@ -175,6 +191,7 @@ class TimeServerService:
     def stop_sync_service(self):
         """Stop the background time sync service"""
         self.running = False
+        self._stop.set()
         if self.sync_thread:
             self.sync_thread.join(timeout=1)
 
@@ -188,15 +205,14 @@ class TimeServerService:
             elif result and 'error' in result:
                 self.logger.warning(f"Time sync failed: {result['error']}")
 
-            # Wait for next sync
-            elapsed = 0
-            while elapsed < self.sync_interval and self.running:
-                time.sleep(0.1)
-                elapsed += 0.1
+            # One wakeup per interval; the event fires early on stop
+            if self._stop.wait(self.sync_interval):
+                break
 
     def update_timezone(self, new_timezone: str):
         """Update the timezone and refresh server list"""
         self.timezone_name = new_timezone
+        self._tzinfo = self._resolve_timezone(new_timezone)
         self.ntp_servers = self.get_servers_for_timezone(new_timezone)
         self.logger.info(f"Timezone updated to {new_timezone}")
 
@@ -214,7 +230,7 @@ class TimeServerService:
             'sync_offset': self.sync_offset,
             'sync_interval': self.sync_interval,
             'running': self.running,
-            'current_time': self.get_current_time().strftime('%Y-%m-%d %H:%M:%S %Z')
+            'current_time': _format_with_tz(self.get_current_time())
         }
 
 
@@ -3,7 +3,7 @@ Database backup and restore utilities for BigTime.
 Provides abstracted methods for backup and restore operations used across client and server.
 """
 
-import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple
@@ -11,6 +11,31 @@ from typing import Optional, Tuple
 from shared.utils import get_data_path
 
 
+def _sqlite_copy(source: Path, dest: Path) -> None:
+    """Copy a database through SQLite's backup API instead of a file copy.
+
+    The databases run in WAL mode with long-lived connections, so at any
+    moment committed rows may still sit in the '-wal' sidecar; a bare
+    file copy of the main database silently drops them. The backup API
+    reads through SQLite itself, so the copy contains every committed
+    transaction and its main file is complete on its own. Writing a
+    restore through it likewise rewrites the live
+    database in place rather than swapping the file, so any stale
+    '-wal'/'-shm' sidecars are recovered normally instead of being
+    replayed over a different main file (a documented corruption
+    scenario), and open handles in other threads stay valid.
+    """
+    src = sqlite3.connect(str(source))
+    try:
+        dst = sqlite3.connect(str(dest))
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
 def get_backup_dir() -> Path:
     """Get the backups directory path, creating it if necessary."""
     backup_dir = get_data_path("backups")
@@ -65,7 +90,7 @@ def create_backup(db_name: str, is_server: bool = False) -> Optional[Path]:
     backup_path = backup_dir / backup_name
 
     try:
-        shutil.copy2(db_path, backup_path)
+        _sqlite_copy(db_path, backup_path)
         return backup_path
     except Exception as e:
         raise IOError(f"Failed to create backup: {e}")
@@ -99,7 +124,7 @@ def create_backup_from_source(source_path: str) -> Path:
     backup_path = backup_dir / backup_name
 
     try:
-        shutil.copy2(source, backup_path)
+        _sqlite_copy(source, backup_path)
         return backup_path
     except Exception as e:
         raise IOError(f"Failed to create backup: {e}")
@@ -130,8 +155,9 @@ def restore_from_backup(backup_path: Path, db_name: str) -> bool:
         if db_path.exists():
             create_backup(db_name)
 
-        # Restore from backup
-        shutil.copy2(backup_path, db_path)
+        # Restore by writing through SQLite into the existing database
+        # rather than replacing the file; see _sqlite_copy for why
+        _sqlite_copy(backup_path, db_path)
         return True
     except Exception as e:
         raise IOError(f"Failed to restore from backup: {e}")
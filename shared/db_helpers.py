@@ -5,6 +5,7 @@ Supports both local SQLite database and remote API operations.
 
 import re
 import sqlite3
+import threading
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -123,10 +124,10 @@ def init_database():
     """Initialize the database with required tables and migrations"""
     db_path = get_db_path()
     conn = sqlite3.connect(str(db_path))
-    # Use traditional journal mode for simpler, more reliable concurrency
+    # WAL keeps readers and the single writer from blocking each other
     try:
         conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
-        conn.execute("PRAGMA journal_mode = DELETE")
+        conn.execute("PRAGMA journal_mode = WAL")
 
         # Check integrity and repair if needed
         cursor = conn.execute("PRAGMA integrity_check")
@@ -196,25 +197,118 @@ def init_database():
             )
         """)
 
+        # Indexes for the hot paths: ranged report/log queries by badge
+        # and the open-log check performed on every clock action
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_logs_badge_clockin
+            ON logs(badge, clock_in)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_logs_open
+            ON logs(badge) WHERE clock_out IS NULL
+        """)
+
         conn.commit()
+
+        # Let SQLite refresh planner statistics now that indexes exist
+        try:
+            conn.execute("PRAGMA optimize")
+        except Exception:
+            pass
     except Exception as e:
         conn.rollback()
         raise DatabaseException(f"Failed to initialize database: {e}")
     finally:
         conn.close()
 
+class _ThreadConnection(sqlite3.Connection):
+    """Connection cached per thread by get_connection().
+
+    close() keeps the underlying connection open so the existing helper
+    try/finally blocks keep working unchanged while it is reused. It
+    does roll back any transaction still open at that point: helpers
+    that raise after BEGIN but before their own rollback (validation
+    errors mid-transaction) relied on the baseline close() discarding
+    the transaction, and leaving it open would wedge the thread's next
+    BEGIN with "cannot start a transaction within a transaction".
+    """
+
+    def close(self):
+        if self.in_transaction:
+            self.rollback()
+
+    def close_for_real(self):
+        sqlite3.Connection.close(self)
+
+
+_conn_local = threading.local()
+
+# Bumped by close_connection() to invalidate every thread's cached
+# connection. sqlite3 objects are thread-affine, so other threads'
+# handles cannot be closed from here; instead each thread compares its
+# stored generation on the next get_connection() call and reopens.
+_conn_generation = 0
+
+
 def get_connection() -> sqlite3.Connection:
-    """Get a database connection with row factory"""
-    conn = sqlite3.connect(str(get_db_path()))
-    # Improve concurrency: wait up to 5s on locks
-    try:
-        conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
-    except Exception:
-        pass
-    conn.row_factory = sqlite3.Row
+    """Get the calling thread's persistent database connection.
+
+    Each thread keeps one open connection instead of paying
+    connect/close (and schema cache warm-up) on every helper call. WAL
+    mode lets the GUI thread and the network worker read concurrently
+    without blocking each other on writes.
+    """
+    conn = getattr(_conn_local, 'conn', None)
+    if conn is not None and getattr(_conn_local, 'generation', None) != _conn_generation:
+        # Another thread invalidated the cache (restore from backup);
+        # drop the stale handle and fall through to a fresh connect
+        _conn_local.conn = None
+        try:
+            conn.close_for_real()
+        except Exception:
+            pass
+        conn = None
+    if conn is None:
+        conn = sqlite3.connect(str(get_db_path()), factory=_ThreadConnection)
+        try:
+            # Wait up to 5s on locks; WAL + NORMAL sync for concurrent
+            # readers with a single writer; ~4MB page cache
+            conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -4000")
+        except Exception:
+            pass
+        conn.row_factory = sqlite3.Row
+        _conn_local.conn = conn
+        _conn_local.generation = _conn_generation
     return conn
 
 
+def close_connection():
+    """Close the calling thread's connection and invalidate all others.
+
+    Needed before operations that rewrite the database file (restore
+    from backup) so no thread keeps serving rows from a stale handle.
+    The caller's connection closes immediately; other threads (the
+    network worker) see the generation bump and reopen on their next
+    get_connection() call.
+    """
+    global _conn_generation
+    _conn_generation += 1
+    conn = getattr(_conn_local, 'conn', None)
+    if conn is not None:
+        _conn_local.conn = None
+        try:
+            conn.close_for_real()
+        except Exception:
+            pass
+    # The file may be swapped out from under us (restore), so cached
+    # employee rows cannot be trusted either
+    _invalidate_employee_cache()
+
+
 # Settings functions
 def get_setting(key: str, default: Optional[str] = None) -> Optional[str]:
     """Get a setting value from the database"""
@@ -239,6 +333,25 @@ def set_setting(key: str, value: str):
         conn.close()
 
 
+def set_settings(settings: Dict[str, str]):
+    """Set several settings in one transaction.
+
+    Callers that persist a group of related keys (sync config, OOTB
+    setup) should use this instead of looping set_setting, so the batch
+    costs a single commit rather than one per key.
+    """
+    if not settings:
+        return
+    conn = get_connection()
+    try:
+        conn.executemany("""
+            INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)
+        """, list(settings.items()))
+        conn.commit()
+    finally:
+        conn.close()
+
+
 # Employee functions
 def _execute_employee_insert(conn: sqlite3.Connection, employee: Employee, track_change_type: Optional[str] = None) -> int:
     """Execute employee insert with optional change tracking.
@@ -307,6 +420,7 @@ def insert_employee_no_tracking(employee: Employee) -> int:
         conn.execute("BEGIN TRANSACTION")
         return _execute_employee_insert(conn, employee, track_change_type=None)
     finally:
+        _invalidate_employee_cache(employee.badge)
         conn.close()
 
 
@@ -317,13 +431,37 @@ def insert_employee(employee: Employee) -> int:
         conn.execute("BEGIN TRANSACTION")
         return _execute_employee_insert(conn, employee, track_change_type='employee_create')
     finally:
+        _invalidate_employee_cache(employee.badge)
         conn.close()
 
 
+# Badge-keyed cache for get_employee_by_badge. Clock in and clock out
+# each look up the same employee back to back, so serving repeats from
+# memory removes a query from the hot kiosk path. Every employee
+# mutation helper below invalidates the affected badge.
+_employee_cache: Dict[str, Employee] = {}
+_employee_cache_lock = threading.Lock()
+EMPLOYEE_CACHE_MAX = 256
+
+
+def _invalidate_employee_cache(badge: Optional[str] = None):
+    """Drop cached lookups for one badge, or all when badge is None"""
+    with _employee_cache_lock:
+        if badge is None:
+            _employee_cache.clear()
+        else:
+            _employee_cache.pop(badge, None)
+
+
 def get_employee_by_badge(badge: str) -> Optional[Employee]:
-    """Get employee by badge"""
+    """Get employee by badge (cached; mutations invalidate)"""
     validated_badge = validate_badge(badge)
 
+    with _employee_cache_lock:
+        cached = _employee_cache.get(validated_badge)
+    if cached is not None:
+        return cached
+
     conn = get_connection()
     try:
         cursor = conn.execute("""
@@ -334,7 +472,12 @@ def get_employee_by_badge(badge: str) -> Optional[Employee]:
         """, (validated_badge,))
         row = cursor.fetchone()
         if row:
-            return _row_to_employee(row)
+            employee = _row_to_employee(row)
+            with _employee_cache_lock:
+                if len(_employee_cache) >= EMPLOYEE_CACHE_MAX:
+                    _employee_cache.clear()
+                _employee_cache[validated_badge] = employee
+            return employee
         return None
     finally:
         conn.close()
@@ -418,6 +561,9 @@ def update_employee_by_badge_no_tracking(badge: str, updates: Dict[str, Any]) ->
         conn.execute("BEGIN TRANSACTION")
         return _execute_employee_update(conn, badge, updates, track_change_type=None)
     finally:
+        _invalidate_employee_cache(badge)
+        if 'badge' in updates:
+            _invalidate_employee_cache(updates['badge'])
         conn.close()
 
 
@@ -431,6 +577,9 @@ def update_employee_by_badge(badge: str, updates: Dict[str, Any]) -> bool:
         conn.execute("BEGIN TRANSACTION")
         return _execute_employee_update(conn, badge, updates, track_change_type='employee_update')
     finally:
+        _invalidate_employee_cache(badge)
+        if 'badge' in updates:
+            _invalidate_employee_cache(updates['badge'])
         conn.close()
 
 
@@ -470,6 +619,8 @@ def update_employee_badge(old_badge: str, new_badge: str) -> bool:
             raise DatabaseException(f"Failed to update employee badge: {e}")
 
     finally:
+        _invalidate_employee_cache(old_badge)
+        _invalidate_employee_cache(new_badge)
         conn.close()
 
 
@@ -515,6 +666,7 @@ def delete_employee_by_badge(badge: str) -> bool:
         conn.commit()
         return deleted
     finally:
+        _invalidate_employee_cache(badge)
         conn.close()
 
 
@@ -811,6 +963,76 @@ def close_most_recent_log(badge: str, clock_out_time: str) -> bool:
         conn.close()
 
 
+def try_open_log(badge: str, clock_in_time: str, client_id: Optional[str] = None,
+                 device_id: Optional[str] = None, sync_state: str = SyncState.SYNCED.value) -> str:
+    """Atomically open a time log for a badge.
+
+    Collapses the employee lookup, open-log check, and insert into one
+    guarded INSERT inside a single transaction, so three round-trips
+    become one and a rapid double-click cannot race past the open-log
+    check between separate statements.
+
+    Returns:
+        'ok' if a log was opened, 'no_emp' if the badge does not match
+        an employee, 'already_open' if the badge already has an open log
+    """
+    validated_badge = validate_badge(badge)
+    validated_clock_in = validate_datetime_string(clock_in_time, "clock_in_time")
+
+    if client_id and len(client_id) > CLIENT_ID_MAX_LENGTH:
+        raise DatabaseException(f"client_id must be {CLIENT_ID_MAX_LENGTH} characters or less")
+
+    if device_id and len(device_id) > DEVICE_ID_MAX_LENGTH:
+        raise DatabaseException(f"device_id must be {DEVICE_ID_MAX_LENGTH} characters or less")
+
+    conn = get_connection()
+    try:
+        # IMMEDIATE takes the write lock up front so the guard and the
+        # insert see the same state
+        conn.execute("BEGIN IMMEDIATE")
+
+        try:
+            now = format_datetime(datetime.now())
+
+            cursor = conn.execute("""
+                INSERT INTO logs (
+                    badge, clock_in, client_id, device_id, sync_state,
+                    device_ts, created_at, updated_at
+                )
+                SELECT ?, ?, ?, ?, ?, ?, ?, ?
+                WHERE EXISTS (SELECT 1 FROM employees WHERE badge = ?)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM logs WHERE badge = ? AND clock_out IS NULL
+                  )
+            """, (validated_badge, validated_clock_in, client_id, device_id,
+                  sync_state, now, now, now, validated_badge, validated_badge))
+
+            if cursor.rowcount > 0:
+                log_id = cursor.lastrowid
+                conn.commit()
+
+                # Track the change for sync (only if it's not already synced)
+                if sync_state != SyncState.SYNCED.value:
+                    track_change('log_create', str(log_id))
+
+                return 'ok'
+
+            # Nothing inserted: work out which guard failed
+            cursor = conn.execute(
+                "SELECT 1 FROM employees WHERE badge = ?", (validated_badge,)
+            )
+            employee_exists = cursor.fetchone() is not None
+            conn.commit()
+            return 'already_open' if employee_exists else 'no_emp'
+
+        except Exception as e:
+            conn.rollback()
+            raise DatabaseException(f"Failed to open log: {e}")
+
+    finally:
+        conn.close()
+
+
 def get_open_log_for_badge(badge: str) -> Optional[TimeLog]:
     """Get open log entry for a badge"""
     validated_badge = validate_badge(badge)
@@ -937,6 +1159,41 @@ def fetch_logs_for_range(badge: str, start_date: date, end_date: date) -> List[T
         conn.close()
 
 
+def weekly_hours_for_range(badge: str, start_date: str, end_date: str) -> Dict[str, float]:
+    """Aggregate completed hours per week for a badge within a date range.
+
+    Week bucketing and the duration arithmetic (julianday differences)
+    run inside SQLite, so Python never parses individual log timestamps;
+    only one row per week comes back. Weeks are keyed by their Monday
+    ('weekday 0' advances to the next Sunday, minus six days lands on
+    that week's Monday), which matches isocalendar() weeks — strftime's
+    %W restarts numbering at Jan 1 and would split a year-straddling
+    week into two buckets, changing overtime.
+
+    Args:
+        badge: Employee badge
+        start_date: Range start as YYYY-MM-DD string
+        end_date: Range end as YYYY-MM-DD string
+
+    Returns:
+        Mapping of week-start date ('YYYY-MM-DD', a Monday) to summed hours
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.execute("""
+            SELECT date(clock_in, 'weekday 0', '-6 days') AS week,
+                   SUM((julianday(clock_out) - julianday(clock_in)) * 24.0) AS hours
+            FROM logs
+            WHERE badge = ? AND date(clock_in) BETWEEN ? AND ?
+              AND clock_out IS NOT NULL AND clock_out != ''
+            GROUP BY week
+        """, (badge, start_date, end_date))
+
+        return {row['week']: row['hours'] or 0.0 for row in cursor.fetchall()}
+    finally:
+        conn.close()
+
+
 def has_open_log(badge: str) -> bool:
     """Check if employee has an open log entry"""
     open_log = get_open_log_for_badge(badge)
@@ -961,6 +1218,68 @@ def get_all_time_logs() -> List[TimeLog]:
         conn.close()
 
 
+def fetch_logs_between(start_date, end_date) -> List[TimeLog]:
+    """Fetch logs for all badges whose clock_in falls in the date range"""
+    conn = get_connection()
+    try:
+        cursor = conn.execute("""
+            SELECT id, client_id, remote_id, badge, clock_in, clock_out,
+                   device_id, device_ts, sync_state, created_at, updated_at
+            FROM logs
+            WHERE date(clock_in) >= date(?) AND date(clock_in) <= date(?)
+            ORDER BY clock_in DESC
+        """, (format_date(start_date), format_date(end_date)))
+
+        return [_row_to_timelog(row) for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+
+def iter_all_logs(chunk_size: int = 1000):
+    """Iterate all time logs in fixed-size batches.
+
+    Yields lists of TimeLog objects pulled via cursor.fetchmany, so
+    consumers that stream rows out (CSV export and the like) hold at
+    most chunk_size rows in memory instead of the whole table.
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.execute("""
+            SELECT id, client_id, remote_id, badge, clock_in, clock_out,
+                   device_id, device_ts, sync_state, created_at, updated_at
+            FROM logs
+            ORDER BY clock_in
+        """)
+
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield [_row_to_timelog(row) for row in rows]
+    finally:
+        conn.close()
+
+
+def export_logs_csv(path) -> int:
+    """Export all time logs to a CSV file, returning the row count.
+
+    Rows stream through iter_all_logs in batches and the file handle
+    uses a 1 MiB buffer instead of the 8KB default, which keeps write()
+    syscall counts low on slow or removable media.
+    """
+    import csv
+
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'badge', 'clock_in', 'clock_out'])
+        for batch in iter_all_logs():
+            writer.writerows(
+                (log.id, log.badge, log.clock_in, log.clock_out) for log in batch)
+            count += len(batch)
+    return count
+
+
 def update_time_log(log_id: int, clock_in: str, clock_out: str) -> bool:
     """Update time log with new clock in/out times"""
     conn = get_connection()
@@ -987,6 +1306,43 @@ def update_time_log(log_id: int, clock_in: str, clock_out: str) -> bool:
         conn.close()
 
 
+def update_time_logs_bulk(updates: List[tuple]) -> int:
+    """Apply several (log_id, clock_in, clock_out) edits in one transaction.
+
+    Batches what would otherwise be one UPDATE and one commit per edited
+    log into a single executemany, so N edits cost one fsync.
+    """
+    if not updates:
+        return 0
+
+    conn = get_connection()
+    try:
+        now = format_datetime(datetime.now())
+        conn.execute("BEGIN TRANSACTION")
+
+        try:
+            conn.executemany("""
+                UPDATE logs
+                SET clock_in = ?, clock_out = ?, updated_at = ?,
+                    sync_state = ?
+                WHERE id = ?
+            """, [(clock_in, clock_out, now, SyncState.PENDING.value, log_id)
+                  for log_id, clock_in, clock_out in updates])
+
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise DatabaseException(f"Failed to update logs: {e}")
+
+        # Track the changes for sync after the batch lands
+        for log_id, _clock_in, _clock_out in updates:
+            track_change('log_update', str(log_id))
+
+        return len(updates)
+    finally:
+        conn.close()
+
+
 def get_logs_by_badge_and_date_range(badge: str, start_date: str, end_date: str) -> list:
     """Get all logs for a specific employee badge within a date range"""
     conn = get_connection()
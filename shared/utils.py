@@ -5,9 +5,15 @@ Shared utility functions for BigTime application.
 import sys
 import zoneinfo
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
+# Storage format for datetimes; hoisted so strptime callers share one
+# format string instead of re-spelling the literal per call site
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+UI_DATETIME_FORMAT = '%m-%d-%Y %H:%M:%S'
+
 
 def get_resource_path(relative_path: str) -> Path:
     """Get absolute path to resource, works for dev and PyInstaller
@@ -91,7 +97,7 @@ def to_int_optional(value: Union[str, int, None]) -> Optional[int]:
 
 def format_datetime(dt: datetime) -> str:
     """Format datetime to standard string format"""
-    return dt.strftime('%Y-%m-%d %H:%M:%S')
+    return dt.strftime(DATETIME_FORMAT)
 
 
 def parse_datetime(dt_str: str) -> Optional[datetime]:
@@ -99,11 +105,13 @@ def parse_datetime(dt_str: str) -> Optional[datetime]:
     if not dt_str:
         return None
     try:
-        return datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S')
+        # fromisoformat is the C fast path and accepts the storage
+        # format ('YYYY-MM-DD HH:MM:SS') directly; strptime re-parses
+        # the format string on every call
+        return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
     except ValueError:
         try:
-            # Try ISO format
-            return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+            return datetime.strptime(dt_str, DATETIME_FORMAT)
         except ValueError:
             return None
 
@@ -146,6 +154,20 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
+@lru_cache(maxsize=32)
+def _get_zoneinfo(name: str) -> Optional[zoneinfo.ZoneInfo]:
+    """Resolve a timezone name once; None when the name is unknown.
+
+    The converters below run per timestamp in batch paths (log editors,
+    reports), so the tz lookup is memoized on the name instead of being
+    re-resolved each call.
+    """
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except Exception:
+        return None
+
+
 def utc_to_local_datetime(utc_dt: datetime, local_tz: str = None) -> datetime:
     """Convert UTC datetime to local timezone for display"""
     if utc_dt.tzinfo is None:
@@ -153,11 +175,9 @@ def utc_to_local_datetime(utc_dt: datetime, local_tz: str = None) -> datetime:
         utc_dt = utc_dt.replace(tzinfo=timezone.utc)
 
     if local_tz:
-        try:
-            local_timezone = zoneinfo.ZoneInfo(local_tz)
+        local_timezone = _get_zoneinfo(local_tz)
+        if local_timezone is not None:
             return utc_dt.astimezone(local_timezone)
-        except Exception:
-            pass
 
     # Fallback to system local timezone
     return utc_dt.astimezone()
@@ -167,12 +187,9 @@ def local_to_utc_datetime(local_dt: datetime, local_tz: str = None) -> datetime:
     """Convert local datetime to UTC for storage"""
     if local_dt.tzinfo is None:
         # Assume it's in the specified local timezone or system timezone
-        if local_tz:
-            try:
-                local_timezone = zoneinfo.ZoneInfo(local_tz)
-                local_dt = local_dt.replace(tzinfo=local_timezone)
-            except Exception:
-                local_dt = local_dt.astimezone()
+        local_timezone = _get_zoneinfo(local_tz) if local_tz else None
+        if local_timezone is not None:
+            local_dt = local_dt.replace(tzinfo=local_timezone)
         else:
             local_dt = local_dt.astimezone()
 
@@ -182,7 +199,7 @@ def local_to_utc_datetime(local_dt: datetime, local_tz: str = None) -> datetime:
 def format_datetime_local(utc_dt: datetime, local_tz: str = None) -> str:
     """Format UTC datetime as local time string for display"""
     local_dt = utc_to_local_datetime(utc_dt, local_tz)
-    return local_dt.strftime('%m-%d-%Y %H:%M:%S')
+    return local_dt.strftime(UI_DATETIME_FORMAT)
 
 
 def parse_datetime_to_utc(dt_str: str, local_tz: str = None) -> Optional[datetime]:
@@ -192,12 +209,12 @@ def parse_datetime_to_utc(dt_str: str, local_tz: str = None) -> Optional[datetim
 
     try:
         # Try MM-dd-yyyy HH:mm:ss format (UI format)
-        local_dt = datetime.strptime(dt_str, '%m-%d-%Y %H:%M:%S')
+        local_dt = datetime.strptime(dt_str, UI_DATETIME_FORMAT)
         return local_to_utc_datetime(local_dt, local_tz)
     except ValueError:
         try:
             # Try standard format
-            local_dt = datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S')
+            local_dt = datetime.strptime(dt_str, DATETIME_FORMAT)
             return local_to_utc_datetime(local_dt, local_tz)
         except ValueError:
             return None
@@ -208,8 +225,17 @@ def get_icon_path() -> Path:
     return get_resource_path('ico.ico')
 
 
+# Built once and reused; every dialog sets the same icon, and rebuilding
+# it means re-reading the icon file (or re-painting the fallback) per call
+_cached_app_icon = None
+
+
 def create_app_icon():
-    """Create QIcon from bundled icon file, with fallback"""
+    """Create QIcon from bundled icon file, with fallback (cached)"""
+    global _cached_app_icon
+    if _cached_app_icon is not None:
+        return _cached_app_icon
+
     from PyQt6.QtCore import Qt
     from PyQt6.QtGui import QBrush, QColor, QIcon, QPainter, QPixmap
 
@@ -224,7 +250,8 @@ def create_app_icon():
     # Try to load the bundled icon file
     if icon_path.exists():
         logger.debug("Using real icon file")
-        return QIcon(str(icon_path))
+        _cached_app_icon = QIcon(str(icon_path))
+        return _cached_app_icon
 
     # Fallback: Create a simple programmatic icon
     logger.warning(f"Icon file not found at {icon_path}, using fallback")
@@ -237,4 +264,5 @@ def create_app_icon():
     painter.drawEllipse(4, 4, 24, 24)
     painter.end()
 
-    return QIcon(pixmap)
+    _cached_app_icon = QIcon(pixmap)
+    return _cached_app_icon
@@ -7,12 +7,16 @@ Main GUI application logic is now in client.gui_app.BigTimeClientApp.
 # Import submodules to ensure they're available for compilation
 from . import dialogs
 from .fonts import fonts
-from .pdf_utils import generate_paystub_pdf
+from .pdf_utils import (generate_combined_paystub_pdf, generate_paystub_pdf,
+                        generate_paystub_pdfs, paystub_height)
 
 __all__ = [
     "dialogs",
     "set_dialog_icon",
     "generate_paystub_pdf",
+    "generate_paystub_pdfs",
+    "generate_combined_paystub_pdf",
+    "paystub_height",
     "fonts"
 ]
 
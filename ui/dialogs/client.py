@@ -3,20 +3,29 @@
 This module contains dialog classes used primarily by the BigTime client
 application for configuration, setup, and management.
 """
+import re
 from datetime import date
+from pathlib import Path
 from typing import Any, Dict
 
-from PyQt6.QtCore import QDate, QDateTime, Qt, pyqtSignal
+from PyQt6.QtCore import (QAbstractTableModel, QDate, QDateTime, QModelIndex,
+                          QObject, QRegularExpression, QRunnable, QThreadPool,
+                          QTime, QTimer, Qt, pyqtSignal)
+from PyQt6.QtGui import QRegularExpressionValidator
 from PyQt6.QtWidgets import (QCheckBox, QComboBox, QDateEdit, QDateTimeEdit,
                              QDialog, QDialogButtonBox, QDoubleSpinBox,
                              QFileDialog, QFormLayout, QGroupBox, QHBoxLayout,
                              QHeaderView, QLabel, QLineEdit, QPushButton,
-                             QSpinBox, QTableWidget, QTableWidgetItem,
-                             QVBoxLayout, QMessageBox)
+                             QSpinBox, QStyledItemDelegate, QTableView,
+                             QTableWidget, QTableWidgetItem, QVBoxLayout,
+                             QMessageBox)
 
 import shared
 from shared.models import Employee
-from shared.utils import create_app_icon
+from shared.utils import (create_app_icon, format_datetime, parse_datetime,
+                          parse_datetime_to_utc, utc_to_local_datetime)
+from ui.dialogs.shared import (LazyCalendarDateEdit, UI_DATE_FORMAT,
+                               dialog_button_box)
 from ui.fonts import fonts
 
 __all__ = [
@@ -40,11 +49,345 @@ def set_dialog_icon(dialog):
     dialog.setWindowIcon(create_app_icon())
 
 
+# Sentinel date shown in employee forms when no real date is available
+_DEFAULT_FORM_QDATE = QDate(2000, 1, 1)
+
+# Standard button combination, OR'ed once at import instead of per dialog
+_SAVE_CANCEL_BUTTONS = (QDialogButtonBox.StandardButton.Save
+                        | QDialogButtonBox.StandardButton.Cancel)
+
+
+# Display format used by the log editor's datetime columns
+_EDITOR_DT_FORMAT = UI_DATE_FORMAT + ' HH:mm:ss'
+
+
+# Last directory picked in a Browse dialog; reused as the start
+# directory on the next browse so repeat picks open where the user was
+_last_browse_dir = ''
+
+
+# Exactly four ASCII digits; str.isdigit also accepts non-ASCII digit
+# codepoints that int() and storage would choke on
+_PIN_RE = re.compile(r'\A[0-9]{4}\Z')
+
+# Keystroke-level counterpart of _PIN_RE, enforced by Qt while typing
+_PIN_INPUT_RE = QRegularExpression(r'[0-9]{0,4}')
+
+
+def _install_pin_validator(edit: QLineEdit) -> None:
+    """Restrict a PIN field to ASCII digits as the user types"""
+    edit.setValidator(QRegularExpressionValidator(_PIN_INPUT_RE, edit))
+
+
+def _warn_invalid_pin(dialog, message):
+    """Shared 'Invalid PIN' warning used by the PIN-validating dialogs"""
+    QMessageBox.warning(dialog, "Invalid PIN", message)
+
+
+# Session shared by connection tests so a re-test reuses the keep-alive
+# connection instead of paying a fresh TCP/TLS handshake
+_http_session = None
+
+
+def _get_http_session():
+    global _http_session
+    if _http_session is None:
+        import requests
+        _http_session = requests.Session()
+    return _http_session
+
+
+def _probe_server(server_url: str, api_key: str) -> str:
+    """Probe /health (and /api/v1/info when an API key is given).
+
+    Returns the status-label message; never raises. Runs on a worker
+    thread, so it must not touch any widgets.
+    """
+    import requests
+
+    session = _get_http_session()
+    try:
+        headers = {'Content-Type': 'application/json'}
+        if api_key:
+            headers['Authorization'] = f'Bearer {api_key}'
+
+        # Test /health endpoint first
+        response = session.get(f"{server_url}/health", headers=headers, timeout=10)
+
+        if response.status_code == 200:
+            # Also test /api/v1/info to verify API key works
+            if not api_key:
+                return "✅ Server reachable (no API key to test)"
+            try:
+                info_response = session.get(
+                    f"{server_url}/api/v1/info",
+                    headers=headers,
+                    timeout=5
+                )
+                if info_response.status_code == 200:
+                    data = info_response.json()
+                    if data.get('success'):
+                        company = data.get('data', {}).get('company_name', 'Unknown')
+                        return f"✅ Connected to {company}!"
+                    return "✅ Connection successful (verify API key)"
+                if info_response.status_code == 401:
+                    return "⚠️ Server reachable but API key invalid"
+                return f"✅ Server reachable (API status: {info_response.status_code})"
+            except Exception:
+                return "✅ Server reachable (couldn't verify API key)"
+        elif response.status_code == 401:
+            return "⚠️ Server reachable but authentication failed"
+        else:
+            return f"❌ Server error: HTTP {response.status_code}"
+
+    except requests.exceptions.ConnectionError as e:
+        error_msg = str(e)
+        if "Errno 10061" in error_msg or "Connection refused" in error_msg:
+            return "❌ Server not running or port blocked"
+        if "Name or service not known" in error_msg or "nodename nor servname provided" in error_msg:
+            return "❌ Invalid server address"
+        return f"❌ Cannot connect: {error_msg[:50]}"
+    except requests.exceptions.Timeout:
+        return "❌ Connection timeout (server too slow or unreachable)"
+    except Exception as e:
+        return f"❌ Connection failed: {str(e)[:60]}"
+
+
+class _ConnTestSignals(QObject):
+    """Signal holder for _ConnTestTask (QRunnable cannot own signals)"""
+    done = pyqtSignal(str)
+
+
+class _ConnTestTask(QRunnable):
+    """Runs _probe_server off the GUI thread"""
+
+    def __init__(self, server_url: str, api_key: str):
+        super().__init__()
+        self.signals = _ConnTestSignals()
+        self._server_url = server_url
+        self._api_key = api_key
+
+    def run(self):
+        self.signals.done.emit(_probe_server(self._server_url, self._api_key))
+
+
+def _start_connection_test(dialog, server_url: str, api_key: str) -> None:
+    """Kick off a threaded server probe for a dialog.
+
+    The dialog must expose test_btn and status_label; both test dialogs
+    share this instead of each pumping processEvents around blocking
+    requests calls on the GUI thread.
+    """
+    if not server_url:
+        dialog.status_label.setText("❌ Enter server URL first")
+        return
+
+    dialog.test_btn.setText("Testing...")
+    dialog.test_btn.setEnabled(False)
+    dialog.status_label.setText("⏳ Connecting to server...")
+
+    task = _ConnTestTask(server_url, api_key)
+
+    def on_done(message, dialog=dialog):
+        dialog._conn_test_task = None
+        dialog.status_label.setText(message)
+        dialog.test_btn.setText("Test Connection")
+        dialog.test_btn.setEnabled(True)
+
+    task.signals.done.connect(on_done, Qt.ConnectionType.QueuedConnection)
+    # Keep the task alive until its signal has fired
+    dialog._conn_test_task = task
+    QThreadPool.globalInstance().start(task)
+
+
+def _storage_to_local_qdt(value, server_timezone, fallback=None):
+    """Convert a stored UTC datetime string to a local-time QDateTime.
+
+    Falls back to `fallback` (or the current time) when the value is
+    missing or invalid, matching the old inline editor behavior. Callers
+    converting many rows pass one shared fallback so the system clock is
+    read once per batch rather than per row.
+    """
+    # No try/except: parse_datetime returns None on bad input,
+    # utc_to_local_datetime swallows timezone errors itself, and
+    # QDateTime construction never raises — validity checks are enough
+    if value:
+        utc_dt = parse_datetime(value)
+        if utc_dt:
+            local_dt = utc_to_local_datetime(utc_dt, server_timezone)
+            # Build from integer components; QDateTime.fromString
+            # re-interprets the format string on every call and is
+            # far slower than direct construction
+            qt_dt = QDateTime(
+                QDate(local_dt.year, local_dt.month, local_dt.day),
+                QTime(local_dt.hour, local_dt.minute, local_dt.second))
+            if qt_dt.isValid():
+                return qt_dt
+    return fallback if fallback is not None else QDateTime.currentDateTime()
+
+
+class _LogEditModel(QAbstractTableModel):
+    """Model behind EditLogsDialog's table.
+
+    Each row holds the log id, local-time clock in/out QDateTimes, the
+    still-clocked-in flag, and a removed marker. Editors are created by
+    the view only while a cell is actually being edited, so opening the
+    dialog costs no per-row widget construction.
+    """
+
+    HEADERS = ('Log ID', 'Clock In', 'Clock Out', 'Still In', '')
+    COL_ID, COL_IN, COL_OUT, COL_STILL_IN, COL_REMOVE = range(5)
+
+    def __init__(self, logs, server_timezone, parent=None):
+        super().__init__(parent)
+        now = QDateTime.currentDateTime()
+        # Memoize conversions on the raw stored string: batches often
+        # repeat timestamps (shared clock-ins, empty clock-outs), and
+        # rows never mutate a QDateTime in place, so sharing is safe
+        conv: Dict[Any, QDateTime] = {}
+
+        def to_qdt(value):
+            qdt = conv.get(value)
+            if qdt is None:
+                qdt = conv[value] = _storage_to_local_qdt(
+                    value, server_timezone, now)
+            return qdt
+
+        self._rows = [
+            {
+                'id': log_id,
+                'in': to_qdt(clock_in),
+                'out': to_qdt(clock_out),
+                'still_in': not clock_out,
+                'removed': False,
+            }
+            for log_id, clock_in, clock_out in logs
+        ]
+        # Log id -> row index, so id-keyed operations skip the row scan
+        self._row_by_id = {row['id']: r for r, row in enumerate(self._rows)}
+        # Log ids touched by setData; untouched rows never need saving
+        self._dirty = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def flags(self, index):
+        row = self._rows[index.row()]
+        if row['removed']:
+            return Qt.ItemFlag.NoItemFlags
+
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        col = index.column()
+        if col == self.COL_IN or (col == self.COL_OUT and not row['still_in']):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        elif col == self.COL_STILL_IN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == self.COL_ID:
+                return str(row['id'])
+            if col == self.COL_IN:
+                return row['in'].toString(_EDITOR_DT_FORMAT)
+            if col == self.COL_OUT:
+                if row['still_in']:
+                    return 'Still clocked in'
+                return row['out'].toString(_EDITOR_DT_FORMAT)
+            if col == self.COL_REMOVE:
+                return 'Remove'
+        elif role == Qt.ItemDataRole.EditRole:
+            if col == self.COL_IN:
+                return row['in']
+            if col == self.COL_OUT:
+                return row['out']
+        elif role == Qt.ItemDataRole.CheckStateRole and col == self.COL_STILL_IN:
+            return (Qt.CheckState.Checked if row['still_in']
+                    else Qt.CheckState.Unchecked)
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.EditRole and col in (self.COL_IN, self.COL_OUT):
+            row['in' if col == self.COL_IN else 'out'] = value
+            self._dirty.add(row['id'])
+            self.dataChanged.emit(index, index)
+            return True
+
+        if role == Qt.ItemDataRole.CheckStateRole and col == self.COL_STILL_IN:
+            row['still_in'] = Qt.CheckState(value) == Qt.CheckState.Checked
+            self._dirty.add(row['id'])
+            if row['still_in']:
+                # Parity with the old editor: reset the hidden clock-out
+                # to the current time while it is inactive
+                row['out'] = QDateTime.currentDateTime()
+            self.dataChanged.emit(index, self.index(index.row(), self.COL_OUT))
+            return True
+
+        return False
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def log_id_at(self, row: int):
+        """Log id for a view row"""
+        return self._rows[row]['id']
+
+    def mark_removed(self, log_id):
+        """Disable a row after its log has been removed"""
+        r = self._row_by_id.get(log_id)
+        if r is None:
+            return
+        self._rows[r]['removed'] = True
+        self.dataChanged.emit(self.index(r, 0),
+                              self.index(r, self.COL_REMOVE))
+
+    def iter_dirty_rows(self):
+        """Yield row dicts that were edited and have not been removed"""
+        for row in self._rows:
+            if row['id'] in self._dirty and not row['removed']:
+                yield row
+
+
+class _DateTimeDelegate(QStyledItemDelegate):
+    """Creates a calendar-popup QDateTimeEdit only when editing begins"""
+
+    def createEditor(self, parent, option, index):
+        editor = QDateTimeEdit(parent)
+        editor.setCalendarPopup(True)
+        editor.setDisplayFormat(_EDITOR_DT_FORMAT)
+        return editor
+
+    def setEditorData(self, editor, index):
+        value = index.data(Qt.ItemDataRole.EditRole)
+        if isinstance(value, QDateTime) and value.isValid():
+            editor.setDateTime(value)
+        else:
+            editor.setDateTime(QDateTime.currentDateTime())
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.dateTime(), Qt.ItemDataRole.EditRole)
+
+
 class EditLogsDialog(QDialog):
-    """Dialog for editing multiple time logs with inline editors.
+    """Dialog for editing multiple time logs in a table.
 
     Allows users to modify clock-in and clock-out times for time entries,
-    with timezone-aware datetime editing and validation.
+    with timezone-aware datetime editing and validation. Rows live in a
+    _LogEditModel; QDateTimeEdit editors are created by the delegate only
+    while a cell is being edited, so opening the dialog stays cheap no
+    matter how many logs are passed in.
 
     Signals:
         log_removed: Emitted when a log is removed (int: log_id)
@@ -66,11 +409,6 @@ class EditLogsDialog(QDialog):
         self.setMinimumSize(500,150)
 
         layout = QVBoxLayout(self)
-        self.edits = []
-        self.remove_buttons = {}
-
-        from shared.utils import (format_datetime_local, parse_datetime,
-                                  utc_to_local_datetime)
 
         # Header
         info_label = QLabel('Modify clock-in and clock-out times for selected logs. Times are displayed in your local timezone.')
@@ -78,110 +416,39 @@ class EditLogsDialog(QDialog):
         info_label.setStyleSheet('color: #666;')
         layout.addWidget(info_label)
 
-        for log_id, clock_in, clock_out in logs:
-            row_layout = QHBoxLayout()
-            row_layout.addWidget(QLabel(f'Log ID: {log_id}'))
-
-            # Clock In editor
-            in_edit = QDateTimeEdit()
-            in_edit.setCalendarPopup(True)
-            in_edit.setDisplayFormat('MM-dd-yyyy HH:mm:ss')
-            try:
-                if clock_in:
-                    # Parse UTC datetime from storage and convert to local for display
-                    utc_dt = parse_datetime(clock_in)
-                    if utc_dt:
-                        local_dt = utc_to_local_datetime(utc_dt, self.server_timezone)
-                        qt_dt = QDateTime.fromString(local_dt.strftime('%m-%d-%Y %H:%M:%S'), 'MM-dd-yyyy HH:mm:ss')
-                        if qt_dt.isValid():
-                            in_edit.setDateTime(qt_dt)
-                        else:
-                            in_edit.setDateTime(QDateTime.currentDateTime())
-                    else:
-                        in_edit.setDateTime(QDateTime.currentDateTime())
-                else:
-                    in_edit.setDateTime(QDateTime.currentDateTime())
-            except Exception:
-                in_edit.setDateTime(QDateTime.currentDateTime())
-
-            # Clock Out editor
-            out_edit = QDateTimeEdit()
-            out_edit.setCalendarPopup(True)
-            out_edit.setDisplayFormat('MM-dd-yyyy HH:mm:ss')
+        self.model = _LogEditModel(logs, server_timezone, self)
 
-            # Checkbox to indicate if entry should remain clocked in (no clock out)
-            still_clocked_in = QCheckBox("Still clocked in")
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setColumnWidth(_LogEditModel.COL_ID, 60)
+        self.table.setColumnWidth(_LogEditModel.COL_IN, 140)
+        self.table.setColumnWidth(_LogEditModel.COL_OUT, 140)
+        self.table.setColumnWidth(_LogEditModel.COL_STILL_IN, 60)
+        self.table.setColumnWidth(_LogEditModel.COL_REMOVE, 70)
 
-            # Track the original state and setup the controls
-            originally_clocked_in = not clock_out
+        # One delegate serves both datetime columns
+        self._dt_delegate = _DateTimeDelegate(self.table)
+        self.table.setItemDelegateForColumn(_LogEditModel.COL_IN, self._dt_delegate)
+        self.table.setItemDelegateForColumn(_LogEditModel.COL_OUT, self._dt_delegate)
 
-            try:
-                if clock_out:
-                    # Parse UTC datetime from storage and convert to local for display
-                    utc_dt = parse_datetime(clock_out)
-                    if utc_dt:
-                        local_dt = utc_to_local_datetime(utc_dt, self.server_timezone)
-                        qt_dt = QDateTime.fromString(local_dt.strftime('%m-%d-%Y %H:%M:%S'), 'MM-dd-yyyy HH:mm:ss')
-                        if qt_dt.isValid():
-                            out_edit.setDateTime(qt_dt)
-                            still_clocked_in.setChecked(False)
-                            out_edit.setEnabled(True)
-                        else:
-                            out_edit.setDateTime(QDateTime.currentDateTime())
-                            still_clocked_in.setChecked(True)
-                            out_edit.setEnabled(False)
-                    else:
-                        out_edit.setDateTime(QDateTime.currentDateTime())
-                        still_clocked_in.setChecked(True)
-                        out_edit.setEnabled(False)
-                else:
-                    out_edit.setDateTime(QDateTime.currentDateTime())
-                    still_clocked_in.setChecked(True)
-                    out_edit.setEnabled(False)
-            except Exception:
-                out_edit.setDateTime(QDateTime.currentDateTime())
-                still_clocked_in.setChecked(originally_clocked_in)
-                out_edit.setEnabled(not originally_clocked_in)
-
-            # Connect checkbox to enable/disable clock out editor
-            def toggle_clock_out(checked):
-                out_edit.setEnabled(not checked)
-                if checked:
-                    # When "still clocked in" is checked, reset to current time but keep disabled
-                    out_edit.setDateTime(QDateTime.currentDateTime())
-
-            still_clocked_in.toggled.connect(toggle_clock_out)
-
-            row_layout.addWidget(QLabel('In:'))
-            row_layout.addWidget(in_edit)
-            row_layout.addWidget(QLabel('Out:'))
-            row_layout.addWidget(out_edit)
-            row_layout.addWidget(still_clocked_in)
-
-            # Remove button
-            remove_btn = QPushButton('Remove')
-            remove_btn.clicked.connect(lambda _, lid=log_id: self.remove_log(lid))
-            row_layout.addWidget(remove_btn)
-            self.remove_buttons[log_id] = remove_btn
-
-            layout.addLayout(row_layout)
-            self.edits.append((log_id, in_edit, out_edit, still_clocked_in))
+        self.table.clicked.connect(self._on_cell_clicked)
+        layout.addWidget(self.table)
 
         # Dialog buttons
-        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
+        self.button_box = dialog_button_box(self, _SAVE_CANCEL_BUTTONS)
         layout.addWidget(self.button_box)
 
     def get_updates(self):
-        """Get the updated log data with proper timezone conversion"""
-        from shared.utils import format_datetime, parse_datetime_to_utc
+        """Get the edited log data with proper timezone conversion.
 
+        Only rows the user actually changed are returned, so an accept
+        with no edits writes nothing to the database.
+        """
         updates = []
-        for log_id, in_edit, out_edit, still_clocked_in in self.edits:
+        for row in self.model.iter_dirty_rows():
             try:
-                # Get local time from UI and convert to UTC for storage
-                local_in_str = in_edit.dateTime().toString('MM-dd-yyyy HH:mm:ss')
+                # Get local time from the model and convert to UTC for storage
+                local_in_str = row['in'].toString(_EDITOR_DT_FORMAT)
                 utc_in_dt = parse_datetime_to_utc(local_in_str, self.server_timezone)
                 in_str = format_datetime(utc_in_dt) if utc_in_dt else ''
             except Exception:
@@ -189,35 +456,28 @@ class EditLogsDialog(QDialog):
 
             try:
                 # Check if employee should remain clocked in (no clock out time)
-                if still_clocked_in.isChecked():
+                if row['still_in']:
                     out_str = ''  # Empty string represents no clock out time
                 else:
-                    # Get local time from UI and convert to UTC for storage
-                    local_out_str = out_edit.dateTime().toString('MM-dd-yyyy HH:mm:ss')
+                    local_out_str = row['out'].toString(_EDITOR_DT_FORMAT)
                     utc_out_dt = parse_datetime_to_utc(local_out_str, self.server_timezone)
                     out_str = format_datetime(utc_out_dt) if utc_out_dt else ''
             except Exception:
                 out_str = ''
 
-            updates.append((log_id, in_str, out_str))
+            updates.append((row['id'], in_str, out_str))
         return updates
 
+    def _on_cell_clicked(self, index):
+        """Dispatch clicks on the Remove column to the row's log"""
+        if index.column() == _LogEditModel.COL_REMOVE:
+            self.remove_log(self.model.log_id_at(index.row()))
+
     def remove_log(self, log_id):
         """Remove a log entry and emit signal for database deletion"""
         self.log_removed.emit(log_id)
-        # Disable the controls for the removed log to provide visual feedback
-        for idx, (lid, in_edit, out_edit, still_clocked_in) in enumerate(self.edits):
-            if lid == log_id:
-                try:
-                    in_edit.setDisabled(True)
-                except Exception:
-                    pass
-                try:
-                    still_clocked_in.setDisabled(True)
-                except Exception:
-                    pass
-                self.remove_buttons[log_id].setDisabled(True)
-                break
+        # Disable the row for the removed log to provide visual feedback
+        self.model.mark_removed(log_id)
         self.close()
 
 
@@ -257,6 +517,7 @@ class EditTimeSelectorDialog(QDialog):
         self.emp_table.setHorizontalHeaderLabels(['ID', 'Name'])
         self.emp_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.emp_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.emp_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.emp_table.setColumnWidth(0, 40)
         self.emp_table.setColumnWidth(1, 320)
         layout.addWidget(self.emp_table)
@@ -264,8 +525,7 @@ class EditTimeSelectorDialog(QDialog):
         # Controls row (date selector and load button)
         controls_row = QHBoxLayout()
         date_label = QLabel('Date:')
-        self.date_edit = QDateEdit()
-        self.date_edit.setCalendarPopup(True)
+        self.date_edit = LazyCalendarDateEdit()
         self.date_edit.setDate(QDate.currentDate())
         load_btn = QPushButton('Load Logs')
 
@@ -283,6 +543,7 @@ class EditTimeSelectorDialog(QDialog):
         self.logs_table.setColumnWidth(1, 160)
         self.logs_table.setColumnWidth(2, 160)
         self.logs_table.setColumnWidth(3, 80)
+        self.logs_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         layout.addWidget(self.logs_table)
 
         # Bottom buttons
@@ -295,6 +556,9 @@ class EditTimeSelectorDialog(QDialog):
         # Hook up signals
         load_btn.clicked.connect(self.load_logs_for_selected)
         close_btn.clicked.connect(self.accept)
+        # Single connection dispatches Edit clicks by row instead of one
+        # button widget + lambda per row
+        self.logs_table.cellClicked.connect(self._on_log_cell_clicked)
 
         # Load employees initially
         self.load_employees()
@@ -303,18 +567,24 @@ class EditTimeSelectorDialog(QDialog):
         """Populate the employee table from the client"""
         try:
             employees = self.client.get_all_employees()
-            self.emp_table.setRowCount(len(employees))
 
-            for r, emp in enumerate(employees):
-                badge_item = QTableWidgetItem(emp.badge)
-                badge_item.setFlags(badge_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                badge_item.setData(Qt.ItemDataRole.UserRole, emp)
+            # Fill with updates/signals suspended so the whole load causes a
+            # single repaint instead of one per cell
+            self.emp_table.setUpdatesEnabled(False)
+            self.emp_table.blockSignals(True)
+            self.emp_table.setSortingEnabled(False)
+            try:
+                self.emp_table.setRowCount(len(employees))
 
-                name_item = QTableWidgetItem(emp.name)
-                name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                for r, emp in enumerate(employees):
+                    badge_item = QTableWidgetItem(emp.badge)
+                    badge_item.setData(Qt.ItemDataRole.UserRole, emp)
 
-                self.emp_table.setItem(r, 0, badge_item)
-                self.emp_table.setItem(r, 1, name_item)
+                    self.emp_table.setItem(r, 0, badge_item)
+                    self.emp_table.setItem(r, 1, QTableWidgetItem(emp.name))
+            finally:
+                self.emp_table.blockSignals(False)
+                self.emp_table.setUpdatesEnabled(True)
 
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to load employees: {e}')
@@ -336,30 +606,49 @@ class EditTimeSelectorDialog(QDialog):
 
             logs = self.client.get_logs_for_range(badge_text, selected_date, selected_date)
 
-            self.logs_table.setRowCount(len(logs))
-
-            for r, log in enumerate(logs):
-                id_item = QTableWidgetItem(str(log.id))
-                id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.logs_table.setItem(r, 0, id_item)
+            # Fill with updates/signals suspended so the whole load causes a
+            # single repaint instead of one per cell
+            self.logs_table.setUpdatesEnabled(False)
+            self.logs_table.blockSignals(True)
+            self.logs_table.setSortingEnabled(False)
+            try:
+                self.logs_table.setRowCount(len(logs))
 
-                ci_item = QTableWidgetItem(log.clock_in or '')
-                ci_item.setFlags(ci_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.logs_table.setItem(r, 1, ci_item)
+                for r, log in enumerate(logs):
+                    id_item = QTableWidgetItem(str(log.id))
+                    id_item.setData(Qt.ItemDataRole.UserRole, log)
+                    self.logs_table.setItem(r, 0, id_item)
 
-                co_item = QTableWidgetItem(log.clock_out or '')
-                co_item.setFlags(co_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.logs_table.setItem(r, 2, co_item)
+                    self.logs_table.setItem(r, 1, QTableWidgetItem(log.clock_in or ''))
+                    self.logs_table.setItem(r, 2, QTableWidgetItem(log.clock_out or ''))
 
-                edit_btn = QPushButton('Edit')
-                edit_btn.clicked.connect(lambda checked, log_obj=log: self.edit_single_log(log_obj))
-                self.logs_table.setCellWidget(r, 3, edit_btn)
+                    edit_item = QTableWidgetItem('Edit')
+                    edit_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                    self.logs_table.setItem(r, 3, edit_item)
+            finally:
+                self.logs_table.blockSignals(False)
+                self.logs_table.setUpdatesEnabled(True)
 
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to load logs: {e}')
 
-    def edit_single_log(self, log):
-        """Open `EditLogsDialog` for a single log and apply changes via the client"""
+    def _on_log_cell_clicked(self, row, column):
+        """Dispatch clicks on the Edit column to the log stored on that row"""
+        if column != 3:
+            return
+        id_item = self.logs_table.item(row, 0)
+        if id_item is None:
+            return
+        log = id_item.data(Qt.ItemDataRole.UserRole)
+        if log is not None:
+            self.edit_single_log(log, row)
+
+    def edit_single_log(self, log, row=None):
+        """Open `EditLogsDialog` for a single log and apply changes via the client.
+
+        When the originating table row is known, the row is mutated in
+        place (or removed) instead of reloading the whole table.
+        """
         try:
             log_data = [(log.id, log.clock_in, log.clock_out)]
             edit_dlg = EditLogsDialog(log_data, self, server_timezone='UTC')
@@ -368,7 +657,10 @@ class EditTimeSelectorDialog(QDialog):
                 try:
                     success = self.client.delete_time_log(removed_log_id)
                     if success:
-                        self.load_logs_for_selected()
+                        if row is not None:
+                            self.logs_table.removeRow(row)
+                        else:
+                            self.load_logs_for_selected()
                     else:
                         QMessageBox.warning(self, 'Warning', 'Failed to remove log entry.')
                 except Exception as e:
@@ -379,86 +671,140 @@ class EditTimeSelectorDialog(QDialog):
             if edit_dlg.exec() == QDialog.DialogCode.Accepted:
                 updates = edit_dlg.get_updates()
                 if updates:
+                    # One transaction regardless of how many logs the
+                    # dialog carried
+                    self.client.update_time_logs(updates)
                     log_id, new_clock_in, new_clock_out = updates[0]
-                    self.client.update_time_log(log_id, new_clock_in, new_clock_out)
-                    self.load_logs_for_selected()
+                    if row is not None:
+                        # Keep the cached log object and the two visible
+                        # cells in sync without rebuilding the table
+                        log.clock_in = new_clock_in
+                        log.clock_out = new_clock_out
+                        self.logs_table.item(row, 1).setText(new_clock_in or '')
+                        self.logs_table.item(row, 2).setText(new_clock_out or '')
+                    else:
+                        self.load_logs_for_selected()
 
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to edit log: {str(e)}')
 
 
 
-class AddEmployeeDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle('Add Employee')
-        self.setModal(True)
-        self.setMinimumSize(400, 300)
-        # self.resize(400, 300)
-
-        layout = QVBoxLayout(self)
-        layout.setSpacing(10)  # Reduce spacing between groups
-
-        # Personal Information Group
-        personal_group = QGroupBox("Personal Information")
-        personal_layout = QFormLayout(personal_group)
+def _line_edit(placeholder: str) -> QLineEdit:
+    """Build a QLineEdit with a placeholder (form-spec factory)"""
+    edit = QLineEdit()
+    edit.setPlaceholderText(placeholder)
+    return edit
 
-        self.name = QLineEdit()
-        self.name.setPlaceholderText("Enter employee full name")
-        personal_layout.addRow('Name:', self.name)
 
-        self.phone = QLineEdit()
-        self.phone.setPlaceholderText("#'s only (5551234567)")
-        personal_layout.addRow('Phone Number:', self.phone)
+def _calendar_date_edit() -> QDateEdit:
+    """Build a calendar-popup QDateEdit (form-spec factory)"""
+    return LazyCalendarDateEdit()
 
-        self.dob = QDateEdit()
-        self.dob.setCalendarPopup(True)
-        personal_layout.addRow('Date of Birth:', self.dob)
 
-        self.ssn = QLineEdit()
-        self.ssn.setPlaceholderText("#'s only (XXXXXXXXX)")
-        personal_layout.addRow('SSN:', self.ssn)
+def _period_combo() -> QComboBox:
+    """Build the pay-period dropdown (form-spec factory)"""
+    box = QComboBox()
+    box.addItems(['hourly', 'monthly'])
+    return box
 
-        layout.addWidget(personal_group)
 
-        # Work Information Group
-        work_group = QGroupBox("Work Information")
-        work_layout = QFormLayout(work_group)
+def _rate_spinbox() -> QDoubleSpinBox:
+    """Build the pay-rate spin box (form-spec factory)"""
+    box = QDoubleSpinBox()
+    box.setMaximum(1000000)
+    box.setPrefix("$")
+    return box
 
-        self.badge = QLineEdit()
-        self.badge.setPlaceholderText("Employee badge/ID number")
-        work_layout.addRow('Badge:', self.badge)
 
-        self.department = QLineEdit()
-        self.department.setPlaceholderText("Department or division")
-        work_layout.addRow('Department:', self.department)
-
-        self.hire_date = QDateEdit()
-        self.hire_date.setCalendarPopup(True)
-        work_layout.addRow('Hire Date:', self.hire_date)
-
-        layout.addWidget(work_group)
-
-        # Pay Information Group
-        pay_group = QGroupBox("Pay Information")
-        pay_layout = QFormLayout(pay_group)
-
-        self.period = QComboBox()
-        self.period.addItems(['hourly', 'monthly'])
-        pay_layout.addRow('Period:', self.period)
+class AddEmployeeDialog(QDialog):
+    # Form layout spec, built once at import: each entry is a group title
+    # and its (attribute, row label, widget factory) rows
+    _FORM_SPEC = (
+        ('Personal Information', (
+            ('name', 'Name:', lambda: _line_edit("Enter employee full name")),
+            ('phone', 'Phone Number:', lambda: _line_edit("#'s only (5551234567)")),
+            ('dob', 'Date of Birth:', _calendar_date_edit),
+            ('ssn', 'SSN:', lambda: _line_edit("#'s only (XXXXXXXXX)")),
+        )),
+        ('Work Information', (
+            ('badge', 'Badge:', lambda: _line_edit("Employee badge/ID number")),
+            ('department', 'Department:', lambda: _line_edit("Department or division")),
+            ('hire_date', 'Hire Date:', _calendar_date_edit),
+        )),
+        ('Pay Information', (
+            ('period', 'Period:', _period_combo),
+            ('rate', 'Rate:', _rate_spinbox),
+        )),
+    )
 
-        self.rate = QDoubleSpinBox()
-        self.rate.setMaximum(1000000)
-        self.rate.setPrefix("$")
-        pay_layout.addRow('Rate:', self.rate)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle('Add Employee')
+        self.setModal(True)
+        self.setMinimumSize(400, 300)
+        # self.resize(400, 300)
 
-        layout.addWidget(pay_group)
+        # Suspend repaints while the form is assembled so construction
+        # triggers one layout pass instead of one per addRow
+        self.setUpdatesEnabled(False)
+        try:
+            layout = QVBoxLayout(self)
+            layout.setSpacing(10)  # Reduce spacing between groups
+
+            for group_title, fields in self._FORM_SPEC:
+                group = QGroupBox(group_title)
+                form_layout = QFormLayout(group)
+                for attr, label, factory in fields:
+                    widget = factory()
+                    setattr(self, attr, widget)
+                    form_layout.addRow(label, widget)
+                layout.addWidget(group)
+
+            # Buttons
+            self.button_box = dialog_button_box(self, _SAVE_CANCEL_BUTTONS)
+            layout.addWidget(self.button_box)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _to_qdate(d) -> QDate:
+        """Convert an optional date to QDate, defaulting to the form sentinel"""
+        if d:
+            return QDate(d.year, d.month, d.day)
+        return _DEFAULT_FORM_QDATE
+
+    @staticmethod
+    def _form_dict_to_employee(data: dict) -> Employee:
+        """Normalize a legacy form dict (MM-dd-yyyy date strings) to Employee"""
+        def to_date(value):
+            if not value:
+                return None
+            s = str(value)
+            # ISO fast path ('YYYY-MM-DD', the storage format) before the
+            # legacy 'MM-dd-yyyy' fixed-position parse; QDate.fromString
+            # re-interprets the format string on every call
+            if len(s) == 10 and s[4] == '-':
+                try:
+                    return date.fromisoformat(s)
+                except ValueError:
+                    return None
+            try:
+                return date(int(s[6:10]), int(s[0:2]), int(s[3:5]))
+            except (ValueError, IndexError):
+                return None
 
-        # Buttons
-        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
-        layout.addWidget(self.button_box)
+        return Employee(
+            name=data.get('name', ''),
+            badge=str(data.get('badge', '')),
+            phone_number=data.get('phone_number') or None,
+            department=data.get('department', ''),
+            date_of_birth=to_date(data.get('date_of_birth')),
+            hire_date=to_date(data.get('hire_date')),
+            ssn=data.get('ssn') or None,
+            period=data.get('period', 'hourly'),
+            rate=float(data.get('rate', 0) or 0)
+        )
 
     def set_data(self, data):
         """Set form data from Employee object or dictionary"""
@@ -466,62 +812,32 @@ class AddEmployeeDialog(QDialog):
             return
 
         try:
-            # Handle Employee object (preferred)
-            if isinstance(data, Employee):
-                self.name.setText(data.name or '')
-                self.phone.setText(str(data.phone_number or ''))
-                self.badge.setText(data.badge or '')
-                self.department.setText(data.department or '')
-                self.ssn.setText(str(data.ssn or ''))
-
-                # Handle dates
-                if data.date_of_birth:
-                    qdate = QDate(data.date_of_birth.year, data.date_of_birth.month, data.date_of_birth.day)
-                    self.dob.setDate(qdate)
-                else:
-                    self.dob.setDate(QDate.fromString('01-01-2000', 'MM-dd-yyyy'))
-
-                if data.hire_date:
-                    qdate = QDate(data.hire_date.year, data.hire_date.month, data.hire_date.day)
-                    self.hire_date.setDate(qdate)
-                else:
-                    self.hire_date.setDate(QDate.fromString('01-01-2000', 'MM-dd-yyyy'))
-
-                # Handle period dropdown
-                idx = self.period.findText(data.period or 'hourly')
-                if idx >= 0:
-                    self.period.setCurrentIndex(idx)
-
-                self.rate.setValue(float(data.rate or 0))
-
-            # Handle dictionary (legacy compatibility)
-            elif isinstance(data, dict):
-                self.name.setText(data.get('name', ''))
-                self.phone.setText(str(data.get('phone_number', '')))
-                self.badge.setText(str(data.get('badge', '')))
-                self.department.setText(data.get('department', ''))
-                self.ssn.setText(str(data.get('ssn', '')))
+            # Legacy dicts are normalized to Employee so the widget
+            # population below exists only once
+            if isinstance(data, dict):
+                data = self._form_dict_to_employee(data)
 
-                # Handle date fields from string format
-                dob_str = data.get('date_of_birth', '01-01-2000')
-                self.dob.setDate(QDate.fromString(dob_str or '01-01-2000', 'MM-dd-yyyy'))
+            self.name.setText(data.name or '')
+            self.phone.setText(str(data.phone_number or ''))
+            self.badge.setText(data.badge or '')
+            self.department.setText(data.department or '')
+            self.ssn.setText(str(data.ssn or ''))
 
-                hire_str = data.get('hire_date', '01-01-2000')
-                self.hire_date.setDate(QDate.fromString(hire_str or '01-01-2000', 'MM-dd-yyyy'))
+            self.dob.setDate(self._to_qdate(data.date_of_birth))
+            self.hire_date.setDate(self._to_qdate(data.hire_date))
 
-                # Handle period dropdown
-                period = data.get('period', 'hourly')
-                idx = self.period.findText(period or 'hourly')
-                if idx >= 0:
-                    self.period.setCurrentIndex(idx)
+            # Handle period dropdown
+            idx = self.period.findText(data.period or 'hourly')
+            if idx >= 0:
+                self.period.setCurrentIndex(idx)
 
-                self.rate.setValue(float(data.get('rate', 0) or 0))
+            self.rate.setValue(float(data.rate or 0))
 
         except Exception as e:
             print(f"Warning: Error setting employee data: {e}")
             # Set safe defaults on error
-            self.dob.setDate(QDate.fromString('01-01-2000', 'MM-dd-yyyy'))
-            self.hire_date.setDate(QDate.fromString('01-01-2000', 'MM-dd-yyyy'))
+            self.dob.setDate(_DEFAULT_FORM_QDATE)
+            self.hire_date.setDate(_DEFAULT_FORM_QDATE)
             self.period.setCurrentIndex(0)
             self.rate.setValue(0.0)
 
@@ -532,8 +848,8 @@ class AddEmployeeDialog(QDialog):
             'phone_number': self.phone.text().strip(),
             'badge': self.badge.text().strip(),
             'department': self.department.text().strip(),
-            'date_of_birth': self.dob.date().toString('MM-dd-yyyy'),
-            'hire_date': self.hire_date.date().toString('MM-dd-yyyy'),
+            'date_of_birth': self.dob.date().toString(UI_DATE_FORMAT),
+            'hire_date': self.hire_date.date().toString(UI_DATE_FORMAT),
             'ssn': self.ssn.text().strip(),
             'period': self.period.currentText(),
             'rate': float(self.rate.value()),
@@ -544,11 +860,10 @@ class AddEmployeeDialog(QDialog):
 
     def get_employee(self) -> Employee:
         """Get form data as Employee object (preferred for internal app use)"""
-        # Helper function to parse dates
-        def parse_form_date(date_str: str) -> date:
-            """Parse MM-dd-yyyy format from QDateEdit"""
+        # Helper function to convert QDateEdit values
+        def form_date(qdate: QDate) -> date:
+            """Convert a QDate from a QDateEdit to a Python date"""
             try:
-                qdate = QDate.fromString(date_str, 'MM-dd-yyyy')
                 return date(qdate.year(), qdate.month(), qdate.day())
             except:
                 return date.today()
@@ -566,8 +881,8 @@ class AddEmployeeDialog(QDialog):
             phone_number=safe_int(self.phone.text()),
             pin='',             # No PIN by default
             department=self.department.text().strip(),
-            date_of_birth=parse_form_date(self.dob.date().toString('MM-dd-yyyy')),
-            hire_date=parse_form_date(self.hire_date.date().toString('MM-dd-yyyy')),
+            date_of_birth=form_date(self.dob.date()),
+            hire_date=form_date(self.hire_date.date()),
             deactivated=False,  # Active by default for new employees
             ssn=safe_int(self.ssn.text()),
             period=self.period.currentText(),
@@ -601,6 +916,7 @@ class EditEmployeeDialog(AddEmployeeDialog):
 
         self.pin = QLineEdit()
         self.pin.setMaxLength(4)
+        _install_pin_validator(self.pin)
         self.pin.setPlaceholderText("Leave empty to keep current PIN")
         security_layout.addRow('PIN:', self.pin)
 
@@ -639,41 +955,33 @@ class EditEmployeeDialog(AddEmployeeDialog):
 
         return updated_employee
 
+    # Fields diffed by plain equality in get_changes; dates and PIN need
+    # special handling and are compared separately
+    _DIFF_FIELDS = ('name', 'badge', 'phone_number', 'department',
+                    'ssn', 'period', 'rate', 'deactivated')
+    _DIFF_DATE_FIELDS = ('date_of_birth', 'hire_date')
+
     def get_changes(self) -> Dict[str, Any]:
         """Get only the fields that have changed as a dictionary for database updates"""
         updated = self.get_employee()
+        original = self.original_employee
         changes = {}
         # Compare with original and only include changed fields
-        if updated.name != self.original_employee.name:
-            changes['name'] = updated.name
-        if updated.badge != self.original_employee.badge:
-            changes['badge'] = updated.badge
-        if updated.phone_number != self.original_employee.phone_number:
-            changes['phone_number'] = updated.phone_number
-        if updated.department != self.original_employee.department:
-            changes['department'] = updated.department
-        if updated.date_of_birth != self.original_employee.date_of_birth:
-            if updated.date_of_birth:
-                changes['date_of_birth'] = updated.date_of_birth.isoformat() if isinstance(updated.date_of_birth, date) else updated.date_of_birth
-            else:
-                changes['date_of_birth'] = None
-        if updated.hire_date != self.original_employee.hire_date:
-            if updated.hire_date:
-                changes['hire_date'] = updated.hire_date.isoformat() if isinstance(updated.hire_date, date) else updated.hire_date
-            else:
-                changes['hire_date'] = None
-        if updated.ssn != self.original_employee.ssn:
-            changes['ssn'] = updated.ssn
-        if updated.period != self.original_employee.period:
-            changes['period'] = updated.period
-        if updated.rate != self.original_employee.rate:
-            changes['rate'] = updated.rate
+        for field in self._DIFF_FIELDS:
+            value = getattr(updated, field)
+            if value != getattr(original, field):
+                changes[field] = value
+        for field in self._DIFF_DATE_FIELDS:
+            value = getattr(updated, field)
+            if value != getattr(original, field):
+                if not value:
+                    changes[field] = None
+                else:
+                    changes[field] = value.isoformat() if isinstance(value, date) else value
         # Only include PIN if it actually changed (not empty field preserving original)
         pin_text = self.pin.text().strip()
-        if pin_text and pin_text != self.original_employee.pin:
+        if pin_text and pin_text != original.pin:
             changes['pin'] = pin_text
-        if updated.deactivated != self.original_employee.deactivated:
-            changes['deactivated'] = updated.deactivated
 
         return changes
 
@@ -682,8 +990,8 @@ class EditEmployeeDialog(AddEmployeeDialog):
         pin = self.pin.text().strip()
 
         # Validate PIN format - allow empty (keeps current PIN), but if provided must be 4 digits
-        if pin and (len(pin) != 4 or not pin.isdigit()):
-            QMessageBox.warning(self, "Invalid PIN", "Employee PIN must be exactly 4 digits. Leave empty to keep current PIN.")
+        if pin and not _PIN_RE.match(pin):
+            _warn_invalid_pin(self, "Employee PIN must be exactly 4 digits. Leave empty to keep current PIN.")
             return
 
         super().accept()
@@ -744,18 +1052,24 @@ class EmployeeListDialog(QDialog):
     def load_employees(self):
         try:
             employees = self.client.get_all_employees()
-            self.table.setRowCount(len(employees))
 
-            for row, emp in enumerate(employees):
-                badge_item = QTableWidgetItem(str(emp.badge))
-                badge_item.setFlags(badge_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                badge_item.setData(Qt.ItemDataRole.UserRole, emp)
+            # Fill with updates/signals suspended so the whole load causes a
+            # single repaint instead of one per cell
+            self.table.setUpdatesEnabled(False)
+            self.table.blockSignals(True)
+            self.table.setSortingEnabled(False)
+            try:
+                self.table.setRowCount(len(employees))
 
-                name_item = QTableWidgetItem(emp.name)
-                name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                for row, emp in enumerate(employees):
+                    badge_item = QTableWidgetItem(str(emp.badge))
+                    badge_item.setData(Qt.ItemDataRole.UserRole, emp)
 
-                self.table.setItem(row, 0, badge_item)
-                self.table.setItem(row, 1, name_item)
+                    self.table.setItem(row, 0, badge_item)
+                    self.table.setItem(row, 1, QTableWidgetItem(emp.name))
+            finally:
+                self.table.blockSignals(False)
+                self.table.setUpdatesEnabled(True)
 
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to load employees: {e}')
@@ -825,7 +1139,50 @@ class EmployeeListDialog(QDialog):
                 QMessageBox.critical(self, 'Error', f'Failed to remove employee: {str(e)}')
 
 
-class ConfigDialog(QDialog):
+class _ManagerSettingsBase(QDialog):
+    """Shared construction for the settings and OOTB setup dialogs.
+
+    Both dialogs carry a masked manager-PIN field and a report-save-path
+    row with a Browse button; building those here keeps the widget
+    wiring in one place instead of duplicated per dialog.
+    """
+
+    def _build_pin_edit(self, manager_pin: str, placeholder: str) -> QLineEdit:
+        """Masked 4-digit PIN line edit"""
+        edit = QLineEdit(manager_pin)
+        edit.setEchoMode(QLineEdit.EchoMode.Password)
+        edit.setMaxLength(4)
+        _install_pin_validator(edit)
+        edit.setPlaceholderText(placeholder)
+        return edit
+
+    def _build_file_group(self, report_save_path: str) -> QGroupBox:
+        """File Settings group holding the path edit and Browse button"""
+        file_group = QGroupBox("File Settings")
+        file_layout = QFormLayout(file_group)
+
+        path_container = QHBoxLayout()
+        self.path_edit = QLineEdit(report_save_path)
+        self.path_edit.setPlaceholderText("Select directory for saving reports")
+        self.browse_btn = QPushButton('Browse...')
+        self.browse_btn.clicked.connect(self.browse)
+
+        path_container.addWidget(self.path_edit)
+        path_container.addWidget(self.browse_btn)
+
+        file_layout.addRow('Report Save Path:', path_container)
+        return file_group
+
+    def browse(self):
+        global _last_browse_dir
+        start_dir = self.path_edit.text() or _last_browse_dir or str(Path.home())
+        dir_path = QFileDialog.getExistingDirectory(self, 'Select Directory', start_dir)
+        if dir_path:
+            _last_browse_dir = dir_path
+            self.path_edit.setText(dir_path)
+
+
+class ConfigDialog(_ManagerSettingsBase):
     def __init__(self, parent=None, manager_pin='', report_save_path=''):
         super().__init__(parent)
         self.setWindowTitle('Settings')
@@ -855,30 +1212,13 @@ class ConfigDialog(QDialog):
         security_group = QGroupBox("Security Settings")
         security_layout = QFormLayout(security_group)
 
-        self.pin_edit = QLineEdit(manager_pin)
-        self.pin_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.pin_edit.setMaxLength(4)
-        self.pin_edit.setPlaceholderText("Enter 4-digit manager PIN")
+        self.pin_edit = self._build_pin_edit(manager_pin, "Enter 4-digit manager PIN")
         security_layout.addRow('Manager PIN:', self.pin_edit)
 
         layout.addWidget(security_group)
 
         # File Settings Group
-        file_group = QGroupBox("File Settings")
-        file_layout = QFormLayout(file_group)
-
-        path_container = QHBoxLayout()
-        self.path_edit = QLineEdit(report_save_path)
-        self.path_edit.setPlaceholderText("Select directory for saving reports")
-        self.browse_btn = QPushButton('Browse...')
-        self.browse_btn.clicked.connect(self.browse)
-
-        path_container.addWidget(self.path_edit)
-        path_container.addWidget(self.browse_btn)
-
-        file_layout.addRow('Report Save Path:', path_container)
-
-        layout.addWidget(file_group)
+        layout.addWidget(self._build_file_group(report_save_path))
 
         bottom_row = QHBoxLayout()
 
@@ -889,24 +1229,18 @@ class ConfigDialog(QDialog):
 
         bottom_row.addStretch()
         # Buttons
-        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
+        self.button_box = dialog_button_box(self, _SAVE_CANCEL_BUTTONS)
         bottom_row.addWidget(self.button_box, 0, Qt.AlignmentFlag.AlignLeft)
 
         layout.addLayout(bottom_row)
-    def browse(self):
-        dir_path = QFileDialog.getExistingDirectory(self, 'Select Directory', self.path_edit.text())
-        if dir_path:
-            self.path_edit.setText(dir_path)
 
     def accept(self):
         """Validate manager PIN before accepting"""
         pin = self.pin_edit.text().strip()
 
         # Validate PIN format - allow empty for no change, but if provided must be 4 digits
-        if pin and (len(pin) != 4 or not pin.isdigit()):
-            QMessageBox.warning(self, "Invalid PIN", "Manager PIN must be exactly 4 digits.")
+        if pin and not _PIN_RE.match(pin):
+            _warn_invalid_pin(self, "Manager PIN must be exactly 4 digits.")
             return
 
         super().accept()
@@ -918,7 +1252,7 @@ class ConfigDialog(QDialog):
         }
 
 
-class OOTBClientDialog(QDialog):
+class OOTBClientDialog(_ManagerSettingsBase):
     def __init__(self, parent=None, manager_pin='', report_save_path=''):
         super().__init__(parent)
         self.setWindowTitle('BigTime Setup')
@@ -943,36 +1277,16 @@ class OOTBClientDialog(QDialog):
         security_group = QGroupBox("Manager Credentials")
         security_layout = QFormLayout(security_group)
 
-        self.pin_edit = QLineEdit(manager_pin)
-        self.pin_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.pin_edit.setMaxLength(4)
-        self.pin_edit.setPlaceholderText("Enter 4-digit PIN")
+        self.pin_edit = self._build_pin_edit(manager_pin, "Enter 4-digit PIN")
         security_layout.addRow('Manager PIN:', self.pin_edit)
 
-        self.pin_confirm_edit = QLineEdit()
-        self.pin_confirm_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.pin_confirm_edit.setMaxLength(4)
-        self.pin_confirm_edit.setPlaceholderText("Confirm PIN")
+        self.pin_confirm_edit = self._build_pin_edit('', "Confirm PIN")
         security_layout.addRow('Confirm PIN:', self.pin_confirm_edit)
 
         layout.addWidget(security_group)
 
         # File Settings Group
-        file_group = QGroupBox("File Settings")
-        file_layout = QFormLayout(file_group)
-
-        path_container = QHBoxLayout()
-        self.path_edit = QLineEdit(report_save_path)
-        self.path_edit.setPlaceholderText("Select directory for saving reports")
-        self.browse_btn = QPushButton('Browse...')
-        self.browse_btn.clicked.connect(self.browse)
-
-        path_container.addWidget(self.path_edit)
-        path_container.addWidget(self.browse_btn)
-
-        file_layout.addRow('Report Save Path:', path_container)
-
-        layout.addWidget(file_group)
+        layout.addWidget(self._build_file_group(report_save_path))
 
         # Server Sync Settings Group
         sync_group = QGroupBox("Server Synchronization (Optional)")
@@ -1024,10 +1338,8 @@ class OOTBClientDialog(QDialog):
         self.status_label = QLabel("")
         sync_layout.addWidget(self.status_label)
 
-        # Generate default device ID
-        self.generate_device_id()
-
-        # Initially disable sync fields
+        # Initially disable sync fields; the default device ID is
+        # generated lazily when sync is first enabled
         self.toggle_sync_fields()
 
         layout.addSpacing(10)
@@ -1048,9 +1360,7 @@ class OOTBClientDialog(QDialog):
         layout.addWidget(restore_group)
 
         # Buttons
-        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
+        self.button_box = dialog_button_box(self, _SAVE_CANCEL_BUTTONS)
         layout.addWidget(self.button_box)
 
     def generate_device_id(self):
@@ -1064,85 +1374,20 @@ class OOTBClientDialog(QDialog):
     def toggle_sync_fields(self):
         """Enable/disable sync fields based on checkbox state"""
         enabled = self.enable_sync_checkbox.isChecked()
+        if enabled and not self.device_id_edit.text():
+            # First enable: fill in a default so users who never turn
+            # sync on skip the hostname/urandom reads entirely
+            self.generate_device_id()
         self.server_url_edit.setEnabled(enabled)
         self.device_id_edit.setEnabled(enabled)
         self.api_key_edit.setEnabled(enabled)
         self.sync_interval_spin.setEnabled(enabled)
 
-    def browse(self):
-        dir_path = QFileDialog.getExistingDirectory(self, 'Select Directory', self.path_edit.text())
-        if dir_path:
-            self.path_edit.setText(dir_path)
-
     def test_connection(self):
         """Test connection to the server (used in OOBE dialog)."""
-        import requests
-        from PyQt6.QtWidgets import QApplication
-
-        server_url = self.server_url_edit.text().strip()
-        api_key = self.api_key_edit.text().strip()
-
-        if not server_url:
-            self.status_label.setText("❌ Enter server URL first")
-            return
-
-        self.test_btn.setText("Testing...")
-        self.test_btn.setEnabled(False)
-        self.status_label.setText("⏳ Connecting to server...")
-        QApplication.processEvents()
-
-        try:
-            headers = {'Content-Type': 'application/json'}
-            if api_key:
-                headers['Authorization'] = f'Bearer {api_key}'
-
-            # Test /health endpoint first
-            response = requests.get(f"{server_url}/health", headers=headers, timeout=10)
-
-            if response.status_code == 200:
-                # Also test /api/v1/info to verify API key works
-                if api_key:
-                    try:
-                        info_response = requests.get(
-                            f"{server_url}/api/v1/info",
-                            headers=headers,
-                            timeout=5
-                        )
-                        if info_response.status_code == 200:
-                            data = info_response.json()
-                            if data.get('success'):
-                                company = data.get('data', {}).get('company_name', 'Unknown')
-                                self.status_label.setText(f"✅ Connected to {company}!")
-                            else:
-                                self.status_label.setText("✅ Connection successful (verify API key)")
-                        elif info_response.status_code == 401:
-                            self.status_label.setText("⚠️ Server reachable but API key invalid")
-                        else:
-                            self.status_label.setText(f"✅ Server reachable (API status: {info_response.status_code})")
-                    except Exception:
-                        self.status_label.setText("✅ Server reachable (couldn't verify API key)")
-                else:
-                    self.status_label.setText("✅ Server reachable (no API key to test)")
-            elif response.status_code == 401:
-                self.status_label.setText("⚠️ Server reachable but authentication failed")
-            else:
-                self.status_label.setText(f"❌ Server error: HTTP {response.status_code}")
-
-        except requests.exceptions.ConnectionError as e:
-            error_msg = str(e)
-            if "Errno 10061" in error_msg or "Connection refused" in error_msg:
-                self.status_label.setText("❌ Server not running or port blocked")
-            elif "Name or service not known" in error_msg or "nodename nor servname provided" in error_msg:
-                self.status_label.setText("❌ Invalid server address")
-            else:
-                self.status_label.setText(f"❌ Cannot connect: {error_msg[:50]}")
-        except requests.exceptions.Timeout:
-            self.status_label.setText("❌ Connection timeout (server too slow or unreachable)")
-        except Exception as e:
-            self.status_label.setText(f"❌ Connection failed: {str(e)[:60]}")
-        finally:
-            self.test_btn.setText("Test Connection")
-            self.test_btn.setEnabled(True)
+        _start_connection_test(self,
+                               self.server_url_edit.text().strip(),
+                               self.api_key_edit.text().strip())
 
     def restore_from_backup(self):
         """Restore database from the most recent backup"""
@@ -1171,6 +1416,11 @@ class OOTBClientDialog(QDialog):
             return
 
         try:
+            # Drop every thread's cached connection before the rewrite,
+            # same as the main window's restore path
+            from shared import db_helpers
+            db_helpers.close_connection()
+
             restore_db(backup_path, 'bigtime.db')
             QMessageBox.information(
                 self,
@@ -1186,8 +1436,8 @@ class OOTBClientDialog(QDialog):
         confirm_pin = self.pin_confirm_edit.text().strip()
 
         # Validate PIN format
-        if not pin or len(pin) != 4 or not pin.isdigit():
-            QMessageBox.warning(self, "Invalid PIN", "Manager PIN must be exactly 4 digits.")
+        if not pin or not _PIN_RE.match(pin):
+            _warn_invalid_pin(self, "Manager PIN must be exactly 4 digits.")
             return
 
         # Validate PIN confirmation
@@ -1221,6 +1471,14 @@ class ClientSyncSettingsDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
+        # Debounce keystroke validation: each change restarts a short
+        # single-shot timer, so validation runs once per typing pause
+        # instead of once per character
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(100)
+        self._validate_timer.timeout.connect(self.validate_inputs)
+
         # Server connection group
         server_group = QGroupBox("Server Connection")
         server_layout = QFormLayout(server_group)
@@ -1228,7 +1486,7 @@ class ClientSyncSettingsDialog(QDialog):
         # Server URL
         self.server_url_input = QLineEdit(server_url)
         self.server_url_input.setPlaceholderText("http://127.0.0.1:5000")
-        self.server_url_input.textChanged.connect(self.validate_inputs)
+        self.server_url_input.textEdited.connect(self._queue_validation)
         server_layout.addRow("Server URL:", self.server_url_input)
 
         # Device ID
@@ -1291,11 +1549,7 @@ class ClientSyncSettingsDialog(QDialog):
         layout.addWidget(self.status_label)
 
         # Buttons
-        self.button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
+        self.button_box = dialog_button_box(self)
         layout.addWidget(self.button_box)
 
         # Initial validation
@@ -1310,6 +1564,10 @@ class ClientSyncSettingsDialog(QDialog):
             self.api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
             self.sender().setText("Show")
 
+    def _queue_validation(self, *_args):
+        """Restart the validation debounce timer (textChanged slot)"""
+        self._validate_timer.start()
+
     def validate_inputs(self):
         """Validate form inputs"""
         valid = True
@@ -1330,73 +1588,9 @@ class ClientSyncSettingsDialog(QDialog):
 
     def test_connection(self):
         """Test connection to the server"""
-        import requests
-        from PyQt6.QtWidgets import QApplication
-
-        server_url = self.server_url_input.text().strip()
-        api_key = self.api_key_input.text().strip()
-
-        if not server_url:
-            self.status_label.setText("❌ Enter server URL first")
-            return
-
-        self.test_btn.setText("Testing...")
-        self.test_btn.setEnabled(False)
-        self.status_label.setText("⏳ Connecting to server...")
-        QApplication.processEvents()
-
-        try:
-            headers = {'Content-Type': 'application/json'}
-            if api_key:
-                headers['Authorization'] = f'Bearer {api_key}'
-
-            # Test /health endpoint first
-            response = requests.get(f"{server_url}/health", headers=headers, timeout=10)
-
-            if response.status_code == 200:
-                # Also test /api/v1/info to verify API key works
-                if api_key:
-                    try:
-                        info_response = requests.get(
-                            f"{server_url}/api/v1/info",
-                            headers=headers,
-                            timeout=5
-                        )
-                        if info_response.status_code == 200:
-                            data = info_response.json()
-                            if data.get('success'):
-                                company = data.get('data', {}).get('company_name', 'Unknown')
-                                self.status_label.setText(f"✅ Connected to {company}!")
-                            else:
-                                self.status_label.setText("✅ Connection successful (verify API key)")
-                        elif info_response.status_code == 401:
-                            self.status_label.setText("⚠️ Server reachable but API key invalid")
-                        else:
-                            self.status_label.setText(f"✅ Server reachable (API status: {info_response.status_code})")
-                    except Exception:
-                        self.status_label.setText("✅ Server reachable (couldn't verify API key)")
-                else:
-                    self.status_label.setText("✅ Server reachable (no API key to test)")
-            elif response.status_code == 401:
-                self.status_label.setText("⚠️ Server reachable but authentication failed")
-            else:
-                self.status_label.setText(f"❌ Server error: HTTP {response.status_code}")
-
-        except requests.exceptions.ConnectionError as e:
-            error_msg = str(e)
-            if "Errno 10061" in error_msg or "Connection refused" in error_msg:
-                self.status_label.setText("❌ Server not running or port blocked")
-            elif "Name or service not known" in error_msg or "nodename nor servname provided" in error_msg:
-                self.status_label.setText("❌ Invalid server address")
-            else:
-                self.status_label.setText(f"❌ Cannot connect: {error_msg[:50]}")
-        except requests.exceptions.Timeout:
-            self.status_label.setText("❌ Connection timeout (server too slow or unreachable)")
-        except Exception as e:
-            self.status_label.setText(f"❌ Connection failed: {str(e)[:60]}")
-        finally:
-            self.test_btn.setText("Test Connection")
-            self.test_btn.setEnabled(True)
+        _start_connection_test(self,
+                               self.server_url_input.text().strip(),
+                               self.api_key_input.text().strip())
 
     def get_values(self):
         """Get the configuration values"""
@@ -1445,6 +1639,7 @@ class PinDialog(QDialog):
         self.pin_input = QLineEdit()
         self.pin_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.pin_input.setMaxLength(4)
+        _install_pin_validator(self.pin_input)
         self.pin_input.setPlaceholderText("Enter 4-digit PIN")
         group_layout.addRow("PIN:", self.pin_input)
 
@@ -1453,22 +1648,40 @@ class PinDialog(QDialog):
             self.confirm_pin_input = QLineEdit()
             self.confirm_pin_input.setEchoMode(QLineEdit.EchoMode.Password)
             self.confirm_pin_input.setMaxLength(4)
+            _install_pin_validator(self.confirm_pin_input)
             self.confirm_pin_input.setPlaceholderText("Confirm PIN")
             group_layout.addRow("Confirm PIN:", self.confirm_pin_input)
 
         layout.addWidget(group_box)
 
+        # Inline validation feedback: a label instead of a QMessageBox,
+        # so a bad PIN doesn't spin a second nested modal event loop
+        self.error_label = QLabel('')
+        self.error_label.setStyleSheet('color: red;')
+        self.error_label.setWordWrap(True)
+        self.error_label.hide()
+        layout.addWidget(self.error_label)
+
+        self.pin_input.textChanged.connect(self._clear_error)
+        if set_flag:
+            self.confirm_pin_input.textChanged.connect(self._clear_error)
+
         # Buttons
-        self.button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
+        self.button_box = dialog_button_box(self)
         layout.addWidget(self.button_box)
 
         # Set focus to PIN input
         self.pin_input.setFocus()
 
+    def _show_error(self, message: str):
+        """Show inline validation feedback under the inputs"""
+        self.error_label.setText(message)
+        self.error_label.show()
+
+    def _clear_error(self):
+        """Hide the inline feedback once the user edits a field"""
+        self.error_label.hide()
+
     def get_pin(self) -> str:
         """Get the entered PIN"""
         return self.pin_input.text().strip()
@@ -1484,15 +1697,15 @@ class PinDialog(QDialog):
         pin = self.get_pin()
 
         # Validate PIN format
-        if not pin or len(pin) != 4 or not pin.isdigit():
-            QMessageBox.warning(self, "Invalid PIN", "PIN must be exactly 4 digits.")
+        if not pin or not _PIN_RE.match(pin):
+            self._show_error("PIN must be exactly 4 digits.")
             return
 
         # Validate PIN confirmation if setting
         if self.is_setting_pin:
             confirm_pin = self.get_confirm_pin()
             if pin != confirm_pin:
-                QMessageBox.warning(self, "PIN Mismatch", "PINs do not match. Please try again.")
+                self._show_error("PINs do not match. Please try again.")
                 return
 
         super().accept()
@@ -4,18 +4,26 @@ This module contains dialog classes used primarily by the BigTime server
 application for configuration, setup, and management.
 """
 
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
-from PyQt6.QtCore import Qt, QRegularExpression
-from PyQt6.QtGui import QRegularExpressionValidator
-from PyQt6.QtWidgets import (QCheckBox, QDialog, QDialogButtonBox,
-                             QFormLayout, QGroupBox, QHBoxLayout, QLabel,
-                             QLineEdit, QMessageBox, QPushButton, QSpinBox,
-                             QTableWidget, QTableWidgetItem, QTextEdit,
+import re
+import uuid
+
+from PyQt6.QtCore import (QAbstractTableModel, QModelIndex, QObject,
+                          QRunnable, QThreadPool, QTimer, Qt, pyqtSignal)
+from PyQt6.QtGui import QIntValidator
+from PyQt6.QtWidgets import (QApplication, QCheckBox, QDialog,
+                             QDialogButtonBox, QFormLayout, QGroupBox,
+                             QHBoxLayout, QInputDialog, QLabel, QLineEdit,
+                             QMessageBox, QPushButton, QSpinBox, QTableView,
                              QVBoxLayout)
 
 import shared
-from shared.utils import create_app_icon
+from shared.logging_config import get_client_logger
+from shared.utils import create_app_icon, format_datetime
+from ui.dialogs.shared import dialog_button_box
 from ui.fonts import fonts
 
 __all__ = [
@@ -25,6 +33,53 @@ __all__ = [
 ]
 
 
+# Dotted-quad host check, compiled once instead of per keystroke
+_HOST_RE = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+
+# Host names accepted without the dotted-quad check
+_HOST_LITERALS = frozenset(('0.0.0.0', '127.0.0.1', 'localhost'))
+
+# Static copy shown in ConfigDialog's information section
+_SERVER_INFO_TEXT = (
+    "The BigTime server provides a REST API for multiple client devices to sync time tracking data. "
+    "Configure the host and port based on your network requirements:\n\n"
+    "• Use 127.0.0.1 (localhost) for single-machine testing\n"
+    "• Use 0.0.0.0 to accept connections from all network interfaces\n"
+    "• Use specific IP address to bind to one network interface\n"
+    "• Default port 5000 should work for most installations\n\n"
+    "Time synchronization uses NTP servers optimized for the selected timezone."
+)
+
+@lru_cache(maxsize=4096)
+def _mask_key(api_key: str) -> str:
+    """Masked display form of an API key.
+
+    Memoized on the key itself: keys are immutable, so repeated refreshes
+    of the table re-use the slice built on first sight.
+    """
+    if len(api_key) > 12:
+        return api_key[:8] + '...' + api_key[-4:]
+    return api_key
+
+
+# Bound on first use: importing server.server at module load would be a
+# circular import, but re-entering the import machinery on every button
+# click is wasted work once the module is loaded
+_get_standalone_db = None
+
+
+def _standalone_db():
+    """Open the server database, binding the lazy import on first call"""
+    global _get_standalone_db
+    if _get_standalone_db is None:
+        from server.server import get_standalone_db
+        _get_standalone_db = get_standalone_db
+    return _get_standalone_db()
+
+# How long typing must pause before keystroke-driven validation runs
+_VALIDATE_DEBOUNCE_MS = 100
+
+
 def set_dialog_icon(dialog: QDialog) -> None:
     """Set the application icon on a dialog.
 
@@ -34,6 +89,163 @@ def set_dialog_icon(dialog: QDialog) -> None:
     dialog.setWindowIcon(create_app_icon())
 
 
+class _ApiKeyModel(QAbstractTableModel):
+    """Read-only model behind ConfigDialog's API key table.
+
+    Cell text (masked key, status, formatted last-used) is computed once
+    per refresh in set_rows rather than in data(): views re-query data()
+    on every paint and scroll, so per-call masking and timestamp parsing
+    would run far more often than the row count suggests.
+    """
+
+    HEADERS = ('API Key', 'Device ID', 'Status', 'Last Used')
+    COL_KEY, COL_DEVICE, COL_STATUS, COL_LAST_USED = range(4)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys = []
+        self._display = []
+
+    @staticmethod
+    def _display_row(api_key, device_id, active, last_used) -> tuple:
+        # last_used arrives already formatted for display: the load query
+        # formats it SQL-side and the in-place update paths pass
+        # minute-precision strings
+        return (_mask_key(api_key),
+                device_id or 'N/A',
+                '✅ Active' if active else '❌ Revoked',
+                last_used or 'Never')
+
+    def set_rows(self, rows) -> None:
+        """Swap in a fresh result set from the api_keys query.
+
+        Rows are plain tuples unpacked positionally in query-column
+        order; skipping the per-field column-name lookups keeps the
+        refresh loop flat.
+        """
+        self.beginResetModel()
+        self._keys = [row[0] for row in rows]
+        self._display = [
+            self._display_row(key, device_id, active, last_used)
+            for key, device_id, active, last_used in rows
+        ]
+        self.endResetModel()
+
+    def insert_key_row(self, api_key: str, device_id: str, last_used: str) -> None:
+        """Prepend a freshly generated key without requerying the table.
+
+        The load query orders by created_at DESC, so a new key belongs at
+        row 0; inserting it directly skips the round trip through the
+        background loader after every generate.
+        """
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._keys.insert(0, api_key)
+        self._display.insert(0, self._display_row(api_key, device_id, True, last_used))
+        self.endInsertRows()
+
+    def mark_revoked(self, row: int) -> None:
+        """Flip a row's status to revoked in place after a revoke."""
+        masked_key, device_id, _status, _last_used = self._display[row]
+        # The revoke UPDATE stores CURRENT_TIMESTAMP (UTC), so format the
+        # same UTC instant; local time would disagree with the next
+        # reload by the UTC offset
+        stamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')
+        self._display[row] = (masked_key, device_id, '❌ Revoked', stamp)
+        self.dataChanged.emit(self.index(row, self.COL_STATUS),
+                              self.index(row, self.COL_LAST_USED))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._display)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def full_key_at(self, row: int) -> str:
+        """Unmasked API key for a view row (for copy/revoke)"""
+        return self._keys[row]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[index.row()][index.column()]
+        if role == Qt.ItemDataRole.UserRole and index.column() == self.COL_KEY:
+            return self._keys[index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class _KeyLoadSignals(QObject):
+    """Signal holder for _KeyLoadTask (QRunnable cannot own signals)"""
+    loaded = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+
+class _KeyLoadTask(QRunnable):
+    """Fetches the api_keys rows off the GUI thread.
+
+    The query runs in a pool thread and the result set is handed back to
+    the dialog via a queued signal, so showing the dialog and refreshing
+    after generate/revoke never block painting on database I/O.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _KeyLoadSignals()
+
+    def run(self):
+        try:
+            conn = _standalone_db()
+            # last_used is formatted in the SQL engine: one strftime per
+            # row there replaces a Python datetime parse + format per row
+            # here, and NULL/unparseable values coalesce to 'Never'
+            cursor = conn.execute("""
+                SELECT key, device_id, active,
+                       COALESCE(strftime('%Y-%m-%d %H:%M', last_used), 'Never')
+                FROM api_keys
+                ORDER BY created_at DESC
+            """)
+            # Plain tuples: the model unpacks positionally, so the
+            # sqlite3.Row wrapper would only add per-row overhead
+            cursor.row_factory = None
+            rows = cursor.fetchall()
+            conn.close()
+            self.signals.loaded.emit(list(rows))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class _DbWriteSignals(QObject):
+    """Signal holder for _DbWriteTask (QRunnable cannot own signals)"""
+    done = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class _DbWriteTask(QRunnable):
+    """Runs a database write off the GUI thread.
+
+    The write callable opens its own connection, commits, and closes;
+    success or failure comes back to the dialog via a queued signal so
+    generate/revoke never freeze the UI on an fsync or WAL-checkpoint
+    stall.
+    """
+
+    def __init__(self, write_fn):
+        super().__init__()
+        self.signals = _DbWriteSignals()
+        self._write_fn = write_fn
+
+    def run(self):
+        try:
+            self._write_fn()
+            self.signals.done.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
 class OOTBDialog(QDialog):
     """Out-of-the-box setup dialog for BigTime server.
 
@@ -94,8 +306,7 @@ class OOTBDialog(QDialog):
         self.port_spin.setPlaceholderText("1024-65535")
         self.port_spin.setMaximumWidth(150)
         # Only allow digits
-        port_validator = QRegularExpressionValidator(QRegularExpression(r"^\d{0,5}$"), self.port_spin)
-        self.port_spin.setValidator(port_validator)
+        self.port_spin.setValidator(QIntValidator(0, 99999, self.port_spin))
         server_layout.addRow("Port:", self.port_spin)
 
         layout.addWidget(server_group)
@@ -128,11 +339,7 @@ class OOTBDialog(QDialog):
         layout.addWidget(restore_group)
 
         # Buttons
-        self.button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
+        self.button_box = dialog_button_box(self)
         layout.addWidget(self.button_box)
 
     def restore_from_backup(self) -> None:
@@ -228,10 +435,18 @@ class ConfigDialog(QDialog):
         server_group = QGroupBox("Server Settings")
         server_layout = QFormLayout(server_group)
 
+        # Debounce keystroke validation: each change restarts a short
+        # single-shot timer, so validation runs once per typing pause
+        # instead of once per character
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(_VALIDATE_DEBOUNCE_MS)
+        self._validate_timer.timeout.connect(self.validate_inputs)
+
         # Host input with validation
         self.host_input = QLineEdit(host)
         self.host_input.setPlaceholderText("0.0.0.0 for all interfaces, 127.0.0.1 for local only")
-        self.host_input.textChanged.connect(self.validate_inputs)
+        self.host_input.textEdited.connect(self._queue_validation)
         server_layout.addRow("Host Address:", self.host_input)
 
         # Port input with text field
@@ -239,9 +454,8 @@ class ConfigDialog(QDialog):
         self.port_input.setPlaceholderText("1024-65535")
         self.port_input.setMaximumWidth(150)
         # Only allow digits
-        port_validator = QRegularExpressionValidator(QRegularExpression(r"^\d{0,5}$"), self.port_input)
-        self.port_input.setValidator(port_validator)
-        self.port_input.textChanged.connect(self.validate_inputs)
+        self.port_input.setValidator(QIntValidator(0, 99999, self.port_input))
+        self.port_input.textEdited.connect(self._queue_validation)
         server_layout.addRow("Port:", self.port_input)
 
         layout.addWidget(server_group)
@@ -251,9 +465,9 @@ class ConfigDialog(QDialog):
         api_layout = QVBoxLayout(api_group)
 
         # API Keys table
-        self.api_table = QTableWidget()
-        self.api_table.setColumnCount(4)
-        self.api_table.setHorizontalHeaderLabels(['API Key', 'Device ID', 'Status', 'Last Used'])
+        self.api_model = _ApiKeyModel(self)
+        self.api_table = QTableView()
+        self.api_table.setModel(self.api_model)
 
         # Set column widths
         header = self.api_table.horizontalHeader()
@@ -262,8 +476,9 @@ class ConfigDialog(QDialog):
         header.setSectionResizeMode(2, header.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(3, header.ResizeMode.ResizeToContents)
 
-        self.api_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.api_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.api_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.api_table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
+        self.api_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.api_table.setMinimumHeight(150)
         api_layout.addWidget(self.api_table)
 
@@ -302,18 +517,12 @@ class ConfigDialog(QDialog):
         info_group = QGroupBox("Server Information")
         info_layout = QVBoxLayout(info_group)
 
-        info_text = QTextEdit()
-        info_text.setMaximumHeight(120)
-        info_text.setReadOnly(True)
-        info_text.setPlainText(
-            "The BigTime server provides a REST API for multiple client devices to sync time tracking data. "
-            "Configure the host and port based on your network requirements:\n\n"
-            "• Use 127.0.0.1 (localhost) for single-machine testing\n"
-            "• Use 0.0.0.0 to accept connections from all network interfaces\n"
-            "• Use specific IP address to bind to one network interface\n"
-            "• Default port 5000 should work for most installations\n\n"
-            "Time synchronization uses NTP servers optimized for the selected timezone."
-        )
+        # Static text: a QLabel avoids the document model, layouter and
+        # scroll area a QTextEdit builds for what is read-only copy
+        info_text = QLabel(_SERVER_INFO_TEXT)
+        info_text.setWordWrap(True)
+        info_text.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse)
         info_layout.addWidget(info_text)
 
         layout.addWidget(info_group)
@@ -323,21 +532,38 @@ class ConfigDialog(QDialog):
         layout.addWidget(self.status_label)
 
         # Buttons
-        self.button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
+        self.button_box = dialog_button_box(self)
         layout.addWidget(self.button_box)
 
+        # In-flight API key load / database write, if any
+        self._key_load_task = None
+        self._db_write_task = None
+
+        # Device ID prompt, built on first generate and reused after
+        self._device_input_dialog = None
+
+        # Last-seen validation input and result, for short-circuiting
+        self._last_validated = None
+        self._last_status = None
+
         # Initial validation
         self.validate_inputs()
 
+    def _queue_validation(self, *_args) -> None:
+        """Restart the validation debounce timer (textChanged slot)"""
+        self._validate_timer.start()
+
     def validate_inputs(self) -> None:
         """Validate user inputs and update UI accordingly."""
         host = self.host_input.text().strip()
         port_text = self.port_input.text().strip()
 
+        # Focus changes and debounce flushes re-enter with identical
+        # text; skip the regex and widget work when nothing changed
+        if (host, port_text) == self._last_validated:
+            return
+        self._last_validated = (host, port_text)
+
         # Basic host validation
         valid = True
         status_msg = "✅ Configuration valid"
@@ -345,10 +571,9 @@ class ConfigDialog(QDialog):
         if not host:
             valid = False
             status_msg = "❌ Host address is required"
-        elif host not in ['0.0.0.0', '127.0.0.1', 'localhost']:
+        elif host not in _HOST_LITERALS:
             # Basic IP validation
-            import re
-            if not re.match(r'^(\d{1,3}\.){3}\d{1,3}$', host):
+            if not _HOST_RE.match(host):
                 valid = False
                 status_msg = "⚠️ Please verify host address format"
 
@@ -366,8 +591,11 @@ class ConfigDialog(QDialog):
                 valid = False
                 status_msg = "❌ Port must be a number"
 
-        self.status_label.setText(status_msg)
-        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(valid)
+        # Only touch the widgets when the outcome actually changed
+        if status_msg != self._last_status:
+            self._last_status = status_msg
+            self.status_label.setText(status_msg)
+            self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(valid)
 
     def showEvent(self, event: Any) -> None:
         """Load API keys when dialog is shown."""
@@ -375,108 +603,92 @@ class ConfigDialog(QDialog):
         self.load_api_keys()
 
     def load_api_keys(self) -> None:
-        """Load and display API keys from the server database."""
-        try:
-            from server.server import get_standalone_db
-
-            conn = get_standalone_db()
-            cursor = conn.execute("""
-                SELECT key, device_id, active, last_used, created_at
-                FROM api_keys
-                ORDER BY created_at DESC
-            """)
-            rows = cursor.fetchall()
-            conn.close()
-
-            self.api_table.setRowCount(len(rows))
-
-            for i, row in enumerate(rows):
-                # Mask API key for display (show first 8 and last 4 characters)
-                api_key = row['key']
-                if len(api_key) > 12:
-                    masked_key = api_key[:8] + '...' + api_key[-4:]
-                else:
-                    masked_key = api_key
+        """Refresh the API key table from the server database.
 
-                self.api_table.setItem(i, 0, QTableWidgetItem(masked_key))
-                self.api_table.setItem(i, 1, QTableWidgetItem(row['device_id'] or 'N/A'))
-
-                status = "✅ Active" if row['active'] else "❌ Revoked"
-                self.api_table.setItem(i, 2, QTableWidgetItem(status))
-
-                last_used = row['last_used'] or 'Never'
-                if last_used != 'Never':
-                    # Format timestamp nicely
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(last_used)
-                        last_used = dt.strftime('%Y-%m-%d %H:%M')
-                    except Exception:
-                        pass
-
-                self.api_table.setItem(i, 3, QTableWidgetItem(last_used))
+        The query runs on the global thread pool; rows arrive via a
+        queued signal so the dialog stays responsive while loading.
+        """
+        task = _KeyLoadTask()
+        task.signals.loaded.connect(
+            self._on_keys_loaded, Qt.ConnectionType.QueuedConnection)
+        task.signals.failed.connect(
+            self._on_keys_failed, Qt.ConnectionType.QueuedConnection)
+        # Keep the task alive until its signals have fired
+        self._key_load_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_keys_loaded(self, rows) -> None:
+        self._key_load_task = None
+        self.api_model.set_rows(rows)
+
+    def _on_keys_failed(self, message: str) -> None:
+        self._key_load_task = None
+        QMessageBox.warning(self, 'Error', f'Failed to load API keys: {message}')
+
+    def _submit_db_write(self, write_fn, on_done, error_title: str) -> None:
+        """Run a database write on the thread pool.
+
+        on_done runs on the GUI thread after the write commits; failures
+        surface as a warning box prefixed with error_title.
+        """
+        task = _DbWriteTask(write_fn)
+        task.signals.done.connect(on_done, Qt.ConnectionType.QueuedConnection)
 
-                # Store full API key in item data for revocation
-                self.api_table.item(i, 0).setData(Qt.ItemDataRole.UserRole, api_key)
+        def on_failed(message: str) -> None:
+            self._db_write_task = None
+            QMessageBox.warning(self, 'Error', f'{error_title}: {message}')
 
-        except Exception as e:
-            QMessageBox.warning(self, 'Error', f'Failed to load API keys: {e}')
+        task.signals.failed.connect(on_failed, Qt.ConnectionType.QueuedConnection)
+        # Keep the task alive until its signals have fired
+        self._db_write_task = task
+        QThreadPool.globalInstance().start(task)
 
     def generate_api_key(self) -> None:
         """Generate a new API key."""
-        try:
-            import uuid
-            from datetime import datetime
-
-            from PyQt6.QtWidgets import QInputDialog
-
-            from server.server import get_standalone_db
-            from shared.utils import format_datetime
-            from shared.logging_config import get_client_logger
-
-            logger = get_client_logger()
-
-            # Get device ID from user
-            device_id, ok = QInputDialog.getText(
-                self, 'New API Key', 'Enter device ID (optional):',
-                text=f'device-{uuid.uuid4().hex[:8]}'
-            )
-
-            if not ok:
-                return
-
-            device_id = device_id.strip() or f'device-{uuid.uuid4().hex[:8]}'
+        logger = get_client_logger()
+
+        # One random hex seeds both device ID forms (placeholder and
+        # fallback); the key draws its own uuid so the visible device ID
+        # never shares bytes with the secret
+        device_hex = uuid.uuid4().hex[:8]
+
+        # Get device ID from user; the prompt dialog is built once and
+        # reused across generates instead of reconstructed per call
+        if self._device_input_dialog is None:
+            prompt = QInputDialog(self)
+            prompt.setWindowTitle('New API Key')
+            prompt.setLabelText('Enter device ID (optional):')
+            self._device_input_dialog = prompt
+        prompt = self._device_input_dialog
+        prompt.setTextValue(f'device-{device_hex}')
+
+        if not prompt.exec():
+            return
 
-            # Generate API key
-            api_key = f'bt-{uuid.uuid4().hex}'
+        device_id = prompt.textValue().strip() or f'device-{device_hex}'
 
-            # Strip any potential whitespace
-            api_key = api_key.strip()
-            logger.info(f"Generated API key: {api_key[:8]}... (length={len(api_key)}, repr={repr(api_key)})")
+        # Generate API key
+        api_key = f'bt-{uuid.uuid4().hex}'
+        now = format_datetime(datetime.now())
+        logger.info(f"Generated API key: {api_key[:8]}... (length={len(api_key)}, repr={repr(api_key)})")
 
-            # Save to database with properly formatted timestamps
-            try:
-                conn = get_standalone_db()
-                now = format_datetime(datetime.now())
-                logger.info(f"Inserting API key {api_key[:8]}... for device {device_id}")
-                conn.execute("""
+        def write() -> None:
+            conn = _standalone_db()
+            logger.info(f"Inserting API key {api_key[:8]}... for device {device_id}")
+            # with conn: commits once on success, rolls back on error
+            with conn:
+                cursor = conn.execute("""
                     INSERT INTO api_keys (key, device_id, created_at, last_used, active)
                     VALUES (?, ?, ?, ?, 1)
                 """, (api_key, device_id, now, now))
-                conn.commit()
 
-                # Verify the insert worked
-                verify_cursor = conn.execute("SELECT key, active FROM api_keys WHERE key = ?", (api_key,))
-                verify_row = verify_cursor.fetchone()
-                if verify_row:
-                    logger.info(f"Successfully inserted API key {api_key[:8]}... (active={verify_row['active']}, length={len(verify_row['key'])})")
-                else:
-                    logger.error(f"Failed to verify API key insertion - key not found immediately after insert!")
+            # rowcount confirms the insert without a verification SELECT
+            logger.info(f"Inserted API key {api_key[:8]}... (rowcount={cursor.rowcount})")
+
+            conn.close()
 
-                conn.close()
-            except Exception as db_error:
-                logger.error(f"Failed to insert API key into database: {db_error}")
-                raise
+        def on_done() -> None:
+            self._db_write_task = None
 
             # Show generated key to user
             QMessageBox.information(
@@ -486,73 +698,80 @@ class ConfigDialog(QDialog):
                 'It will be masked in the list for security.'
             )
 
-            # Refresh the list
-            self.load_api_keys()
+            # Insert the new row directly instead of reloading the table;
+            # trim the stored timestamp to the minute-precision display form
+            self.api_model.insert_key_row(api_key, device_id, now[:16])
 
-        except Exception as e:
-            QMessageBox.warning(self, 'Error', f'Failed to generate API key: {e}')
+        self._submit_db_write(write, on_done, 'Failed to generate API key')
 
     def revoke_api_key(self) -> None:
         """Revoke the selected API key."""
-        try:
-            current_row = self.api_table.currentRow()
-            if current_row < 0:
-                QMessageBox.information(self, 'No Selection', 'Please select an API key to revoke.')
-                return
+        selection = self.api_table.selectionModel()
+        rows = sorted(index.row() for index in selection.selectedRows()) if selection else []
+        if not rows:
+            QMessageBox.information(self, 'No Selection', 'Please select an API key to revoke.')
+            return
 
-            # Get the full API key from item data
-            api_key_item = self.api_table.item(current_row, 0)
-            api_key = api_key_item.data(Qt.ItemDataRole.UserRole)
-
-            # Confirm revocation
-            reply = QMessageBox.question(
-                self, 'Confirm Revocation',
-                f'Are you sure you want to revoke this API key?\n\n'
-                f'Key: {api_key_item.text()}\n'
-                f'Device: {self.api_table.item(current_row, 1).text()}\n\n'
-                'This action cannot be undone.',
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
+        # Get the full (unmasked) API keys from the model
+        api_keys = [self.api_model.full_key_at(row) for row in rows]
 
-            if reply != QMessageBox.StandardButton.Yes:
-                return
+        if len(rows) == 1:
+            masked_key = self.api_model.index(rows[0], _ApiKeyModel.COL_KEY).data()
+            device_id = self.api_model.index(rows[0], _ApiKeyModel.COL_DEVICE).data()
+            detail = f'Key: {masked_key}\nDevice: {device_id}'
+            prompt = 'Are you sure you want to revoke this API key?'
+        else:
+            detail = f'{len(api_keys)} keys selected.'
+            prompt = f'Are you sure you want to revoke {len(api_keys)} API keys?'
+
+        # Confirm revocation
+        reply = QMessageBox.question(
+            self, 'Confirm Revocation',
+            f'{prompt}\n\n'
+            f'{detail}\n\n'
+            'This action cannot be undone.',
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
 
-            # Update database
-            from server.server import get_standalone_db
-            conn = get_standalone_db()
-            conn.execute("""
-                UPDATE api_keys
-                SET active = 0, last_used = CURRENT_TIMESTAMP
-                WHERE key = ?
-            """, (api_key,))
-            conn.commit()
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        def write() -> None:
+            # One transaction (and one fsync) however many keys are selected
+            conn = _standalone_db()
+            with conn:
+                conn.executemany("""
+                    UPDATE api_keys
+                    SET active = 0, last_used = CURRENT_TIMESTAMP
+                    WHERE key = ?
+                """, [(key,) for key in api_keys])
             conn.close()
 
-            QMessageBox.information(self, 'Success', 'API key has been revoked.')
+        def on_done() -> None:
+            self._db_write_task = None
 
-            # Refresh the list
-            self.load_api_keys()
+            # Update the affected rows in place instead of reloading
+            for row in rows:
+                self.api_model.mark_revoked(row)
 
-        except Exception as e:
-            QMessageBox.warning(self, 'Error', f'Failed to revoke API key: {e}')
+            revoked = 'API key has been revoked.' if len(api_keys) == 1 \
+                else f'{len(api_keys)} API keys have been revoked.'
+            QMessageBox.information(self, 'Success', revoked)
+
+        self._submit_db_write(write, on_done, 'Failed to revoke API key')
 
     def copy_api_key(self) -> None:
         """Copy selected API key information to clipboard."""
         try:
-            current_row = self.api_table.currentRow()
+            current_row = self.api_table.currentIndex().row()
             if current_row < 0:
                 QMessageBox.information(self, 'No Selection', 'Please select an API key to copy.')
                 return
 
-            # Get the API key and device ID from the selected row
-            api_key_item = self.api_table.item(current_row, 0)
-            device_id_item = self.api_table.item(current_row, 1)
-            status_item = self.api_table.item(current_row, 2)
-
-            # Get the full API key from item data
-            full_api_key = api_key_item.data(Qt.ItemDataRole.UserRole)
-            device_id = device_id_item.text()
-            status = status_item.text()
+            # Get the full key and display fields from the model
+            full_api_key = self.api_model.full_key_at(current_row)
+            device_id = self.api_model.index(current_row, _ApiKeyModel.COL_DEVICE).data()
+            status = self.api_model.index(current_row, _ApiKeyModel.COL_STATUS).data()
 
             # Check if the key is active
             if "Revoked" in status:
@@ -569,7 +788,6 @@ class ConfigDialog(QDialog):
             copy_text = f"Device-ID: {device_id}\nAPI-Key: {full_api_key}"
 
             # Copy to clipboard
-            from PyQt6.QtWidgets import QApplication
             clipboard = QApplication.clipboard()
             clipboard.setText(copy_text)
 
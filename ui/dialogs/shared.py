@@ -3,24 +3,104 @@
 This module contains dialog classes that are utilized by multiple
 parts of the application (client and/or server).
 """
+import os
+
 from datetime import date
 from pathlib import Path
 from typing import Optional, Tuple
 
-from PyQt6.QtCore import QDate
-from PyQt6.QtWidgets import (QDialog, QDialogButtonBox, QFileDialog,
-                             QFormLayout, QGroupBox, QLabel, QLineEdit,
-                             QMessageBox, QPushButton, QVBoxLayout)
+from PyQt6.QtCore import (QDate, QObject, QRunnable, QThreadPool, Qt,
+                          pyqtSignal)
+from PyQt6.QtWidgets import (QDateEdit, QDialog, QDialogButtonBox,
+                             QFileDialog, QFormLayout, QGroupBox, QLabel,
+                             QLineEdit, QMessageBox, QPushButton, QVBoxLayout)
 
 from shared.utils import create_app_icon
 from ui.fonts import fonts
 
 __all__ = [
     'set_dialog_icon',
+    'dialog_button_box',
+    'LazyCalendarDateEdit',
     'DateRangeDialog',
     'DatabaseSelectDialog'
 ]
 
+# Standard button combinations, OR'ed once at import instead of per dialog
+_SAVE_CANCEL_BUTTONS = (QDialogButtonBox.StandardButton.Save
+                        | QDialogButtonBox.StandardButton.Cancel)
+_OK_CANCEL_BUTTONS = (QDialogButtonBox.StandardButton.Ok
+                      | QDialogButtonBox.StandardButton.Cancel)
+
+# Qt date format used by the UI's date fields, hoisted so the display
+# formats and the toString() calls share one spelling
+UI_DATE_FORMAT = 'MM-dd-yyyy'
+
+
+# Fixed portions of the default-file search, resolved once at import;
+# only the cwd can change between calls
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+_HOME = str(Path.home())
+
+
+def _find_default_file(default_filename: str) -> Optional[str]:
+    """Return the first search-path hit for default_filename, or None.
+
+    One walk of the candidate directories serves both auto-populate and
+    Browse, instead of each re-probing its own copy of the list.
+    """
+    search_paths = (os.getcwd(), _PROJECT_ROOT, _HOME)
+    for search_path in search_paths:
+        potential_file = os.path.join(search_path, default_filename)
+        # Direct stat instead of os.path.exists: same single syscall but
+        # without exists() swallowing the result object and re-wrapping
+        try:
+            os.stat(potential_file)
+        except OSError:
+            continue
+        return potential_file
+    return None
+
+
+class _DefaultFileProbeSignals(QObject):
+    """Signal holder for _DefaultFileProbe (QRunnable cannot own signals)"""
+    found = pyqtSignal(str)
+
+
+class _DefaultFileProbe(QRunnable):
+    """Runs the default-file search off the GUI thread.
+
+    On network filesystems the stat walk can block for seconds; running
+    it on the pool keeps dialog construction instant, with the hit
+    delivered back via a queued signal.
+    """
+
+    def __init__(self, default_filename: str):
+        super().__init__()
+        self.signals = _DefaultFileProbeSignals()
+        self._default_filename = default_filename
+
+    def run(self):
+        hit = _find_default_file(self._default_filename)
+        if hit:
+            self.signals.found.emit(hit)
+
+
+class LazyCalendarDateEdit(QDateEdit):
+    """QDateEdit that attaches its calendar popup on first focus.
+
+    setCalendarPopup(True) is the expensive part of building these edits
+    (it sets up the popup machinery per widget), and most dialog opens
+    never touch the date fields. Deferring it to the first focusInEvent
+    keeps dialog construction cheap; the popup behaves identically once
+    the user actually clicks into the field.
+    """
+
+    def focusInEvent(self, event):
+        if not self.calendarPopup():
+            self.setCalendarPopup(True)
+        super().focusInEvent(event)
+
 
 def set_dialog_icon(dialog: QDialog) -> None:
     """Set the application icon on a dialog.
@@ -31,6 +111,22 @@ def set_dialog_icon(dialog: QDialog) -> None:
     dialog.setWindowIcon(create_app_icon())
 
 
+def dialog_button_box(dialog: QDialog, buttons=_OK_CANCEL_BUTTONS) -> QDialogButtonBox:
+    """Build a standard button box wired to the dialog's accept/reject.
+
+    Args:
+        dialog: The dialog whose accept/reject slots receive the signals
+        buttons: StandardButton combination (defaults to Ok | Cancel)
+
+    Returns:
+        The wired QDialogButtonBox, ready to add to a layout
+    """
+    box = QDialogButtonBox(buttons)
+    box.accepted.connect(dialog.accept)
+    box.rejected.connect(dialog.reject)
+    return box
+
+
 class DateRangeDialog(QDialog):
     """Dialog for selecting a date range for reports.
 
@@ -57,25 +153,20 @@ class DateRangeDialog(QDialog):
         date_group = QGroupBox("Date Range")
         date_layout = QFormLayout(date_group)
 
-        from PyQt6.QtWidgets import QDateEdit
-        self.start_date = QDateEdit()
-        self.start_date.setCalendarPopup(True)
+        self.start_date = LazyCalendarDateEdit()
         self.start_date.setDate(QDate.currentDate())
-        self.start_date.setDisplayFormat('MM-dd-yyyy')
+        self.start_date.setDisplayFormat(UI_DATE_FORMAT)
         date_layout.addRow('Start Date:', self.start_date)
 
-        self.end_date = QDateEdit()
-        self.end_date.setCalendarPopup(True)
+        self.end_date = LazyCalendarDateEdit()
         self.end_date.setDate(QDate.currentDate())
-        self.end_date.setDisplayFormat('MM-dd-yyyy')
+        self.end_date.setDisplayFormat(UI_DATE_FORMAT)
         date_layout.addRow('End Date:', self.end_date)
 
         layout.addWidget(date_group)
 
         # Buttons
-        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
+        self.button_box = dialog_button_box(self)
         layout.addWidget(self.button_box)
 
     def get_dates(self) -> Tuple[str, str]:
@@ -84,7 +175,25 @@ class DateRangeDialog(QDialog):
         Returns:
             Tuple of (start_date, end_date) as MM-dd-yyyy strings
         """
-        return self.start_date.date().toString('MM-dd-yyyy'), self.end_date.date().toString('MM-dd-yyyy')
+        # Formatted from the typed accessors; toString() would re-parse
+        # the format string through Qt's locale machinery on every report
+        start = self.start_date.date()
+        end = self.end_date.date()
+        return (f'{start.month():02d}-{start.day():02d}-{start.year():04d}',
+                f'{end.month():02d}-{end.day():02d}-{end.year():04d}')
+
+    def get_iso_dates(self) -> Tuple[str, str]:
+        """Get the selected date range in ISO form for queries.
+
+        Returns:
+            Tuple of (start_date, end_date) as YYYY-MM-DD strings — the
+            form SQLite's date() and strptime('%Y-%m-%d') accept; the
+            MM-dd-yyyy strings from get_dates are display-only
+        """
+        start = self.start_date.date()
+        end = self.end_date.date()
+        return (f'{start.year():04d}-{start.month():02d}-{start.day():02d}',
+                f'{end.year():04d}-{end.month():02d}-{end.day():02d}')
 
 
 class DatabaseSelectDialog(QDialog):
@@ -151,108 +260,94 @@ class DatabaseSelectDialog(QDialog):
         layout.addStretch()
 
         # Buttons
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
+        button_box = QDialogButtonBox(_OK_CANCEL_BUTTONS)
         button_box.accepted.connect(self.handle_confirmation)
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
-        # Try to auto-populate with default file if it exists
-        self._try_auto_populate_default_file()
+        # Try to auto-populate with default file if it exists; the probe
+        # runs on the thread pool so construction never waits on I/O
+        probe = _DefaultFileProbe(default_filename)
+        probe.signals.found.connect(
+            self._on_default_file_found, Qt.ConnectionType.QueuedConnection)
+        # Keep the task alive until its signal has fired
+        self._probe_task = probe
+        QThreadPool.globalInstance().start(probe)
 
     def browse_for_file(self) -> None:
         """Open file browser to select database file."""
-        import os
-
-        # Try to find the default file first
-        initial_dir = ''
-        default_file = self.default_filename
-
-        # Look for the file in common locations
-        search_paths = [
-            os.getcwd(),  # Current working directory
-            str(Path.cwd().parent),  # Parent of current directory
-            str(Path(__file__).parent.parent.parent),  # Project root
-        ]
-
-        for search_path in search_paths:
-            potential_file = os.path.join(search_path, default_file)
-            if os.path.exists(potential_file):
-                initial_dir = search_path
-                break
-
-        # If not found, use the current directory
-        if not initial_dir:
-            initial_dir = os.getcwd()
+        # Reuse the auto-populate hit instead of re-walking the search
+        # paths; fall back to one shared scan, then the cwd
+        if self.selected_file:
+            initial_dir = os.path.dirname(self.selected_file)
+        else:
+            hit = _find_default_file(self.default_filename)
+            initial_dir = os.path.dirname(hit) if hit else os.getcwd()
 
+        # Skip per-entry icon stats and symlink resolution; both make the
+        # picker crawl on network mounts and neither matters for picking
+        # a database file
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             'Select Database File',
             initial_dir,
-            'SQLite Database Files (*.db);;All Files (*)'
+            'SQLite Database Files (*.db);;All Files (*)',
+            options=(QFileDialog.Option.DontUseCustomDirectoryIcons
+                     | QFileDialog.Option.DontResolveSymlinks)
         )
 
         if file_path:
             self.selected_file = file_path
             # Show just the filename in the input, but store full path
-            self.file_input.setText(str(Path(file_path).name))
+            self.file_input.setText(os.path.basename(file_path))
             self.file_input.setToolTip(file_path)
 
+    # Confirmation prompts per operation, filled in with the chosen file
+    _CONFIRM_PROMPTS = {
+        'migrate': ('Confirm Migration',
+                    'Migrate the selected database?\n\n'
+                    'File: {file}\n\n'
+                    'A backup will be created before migration begins.\n'
+                    'All existing data will be preserved.'),
+        'restore': ('Confirm Restore',
+                    'Restore the selected database?\n\n'
+                    'File: {file}\n\n'
+                    'A backup will be created before restoration begins.\n'
+                    'All existing data will be preserved.'),
+    }
+
     def handle_confirmation(self) -> None:
         """Show confirmation dialog before accepting operation."""
         if not self.selected_file:
             QMessageBox.warning(self, 'No File Selected', 'Please select a database file.')
             return
-        if self.migrate:
-            reply = QMessageBox.question(
-                self,
-                'Confirm Migration',
-                f'Migrate the selected database?\n\n'
-                f'File: {self.file_input.text()}\n\n'
-                'A backup will be created before migration begins.\n'
-                'All existing data will be preserved.',
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
-
-            if reply == QMessageBox.StandardButton.Yes:
-                super().accept()
-        elif self.restore:
-            reply = QMessageBox.question(
-                self,
-                'Confirm Restore',
-                f'Restore the selected database?\n\n'
-                f'File: {self.file_input.text()}\n\n'
-                'A backup will be created before restoration begins.\n'
-                'All existing data will be preserved.',
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
-
-            if reply == QMessageBox.StandardButton.Yes:
-                super().accept()
-        else:
+
+        op = 'migrate' if self.migrate else 'restore' if self.restore else None
+        if op is None:
+            super().accept()
+            return
+
+        title, template = self._CONFIRM_PROMPTS[op]
+        reply = QMessageBox.question(
+            self,
+            title,
+            template.format(file=self.file_input.text()),
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+
+        if reply == QMessageBox.StandardButton.Yes:
             super().accept()
 
-    def _try_auto_populate_default_file(self) -> None:
-        """Try to find and auto-populate the default database file."""
-        import os
-
-        # Search paths in order of likelihood
-        search_paths = [
-            os.getcwd(),  # Current working directory
-            str(Path(__file__).parent.parent.parent),  # Project root
-            str(Path.home()),  # User home directory
-        ]
-
-        for search_path in search_paths:
-            potential_file = os.path.join(search_path, self.default_filename)
-            if os.path.exists(potential_file):
-                self.selected_file = potential_file
-                self.file_input.setText(self.default_filename)
-                self.file_input.setToolTip(potential_file)
-                return
+    def _on_default_file_found(self, potential_file: str) -> None:
+        """Auto-populate the default database file located by the probe."""
+        self._probe_task = None
+        # Don't clobber a file the user already picked via Browse
+        if self.selected_file:
+            return
+        self.selected_file = potential_file
+        self.file_input.setText(self.default_filename)
+        self.file_input.setToolTip(potential_file)
 
     def get_file_path(self) -> str:
         """Get the selected file path.
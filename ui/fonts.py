@@ -5,30 +5,53 @@ Provides consistent font styling across all UI components.
 
 from PyQt6.QtGui import QFont
 
-# Font definitions - direct QFont objects ready to use
-fonts = {
+# Font specs as (family, point size, weight). QFont construction goes
+# through the platform font database, so instances are built lazily on
+# first access instead of all at import — most processes only ever touch
+# a handful of these styles.
+_FONT_SPECS = {
     # Standard Verdana fonts
-    "default": QFont("Verdana", 14),
-    "large": QFont("Verdana", 20),
-    "small": QFont("Verdana", 9),
+    "default": ("Verdana", 14, None),
+    "large": ("Verdana", 20, None),
+    "small": ("Verdana", 9, None),
 
     # Monospace fonts (Courier New) - sized 14 with variants
-    "monospace": QFont("Courier New", 14),
-    "monospace_small": QFont("Courier New", 9),
-    "monospace_large": QFont("Courier New", 20),
+    "monospace": ("Courier New", 14, None),
+    "monospace_small": ("Courier New", 9, None),
+    "monospace_large": ("Courier New", 20, None),
 
     # Bold variants
-    "default_bold": QFont("Verdana", 14, QFont.Weight.Bold),
-    "large_bold": QFont("Verdana", 20, QFont.Weight.Bold),
-    "small_bold": QFont("Verdana", 9, QFont.Weight.Bold),
+    "default_bold": ("Verdana", 14, QFont.Weight.Bold),
+    "large_bold": ("Verdana", 20, QFont.Weight.Bold),
+    "small_bold": ("Verdana", 9, QFont.Weight.Bold),
 
     # Monospace bold variants
-    "monospace_bold": QFont("Courier New", 14, QFont.Weight.Bold),
-    "monospace_small_bold": QFont("Courier New", 9, QFont.Weight.Bold),
-    "monospace_large_bold": QFont("Courier New", 20, QFont.Weight.Bold),
+    "monospace_bold": ("Courier New", 14, QFont.Weight.Bold),
+    "monospace_small_bold": ("Courier New", 9, QFont.Weight.Bold),
+    "monospace_large_bold": ("Courier New", 20, QFont.Weight.Bold),
 
     # Header fonts (larger and bold)
-    "header": QFont("Verdana", 18, QFont.Weight.Bold),
-    "subheader": QFont("Verdana", 16, QFont.Weight.Bold),
-    "title": QFont("Verdana", 24, QFont.Weight.Bold),
+    "header": ("Verdana", 18, QFont.Weight.Bold),
+    "subheader": ("Verdana", 16, QFont.Weight.Bold),
+    "title": ("Verdana", 24, QFont.Weight.Bold),
 }
+
+
+class _FontRegistry:
+    """Dict-like registry that constructs each QFont on first use."""
+
+    def __init__(self):
+        self._cache = {}
+
+    def __getitem__(self, name: str) -> QFont:
+        font = self._cache.get(name)
+        if font is None:
+            family, size, weight = _FONT_SPECS[name]
+            font = (QFont(family, size) if weight is None
+                    else QFont(family, size, weight))
+            self._cache[name] = font
+        return font
+
+
+# Keeps the existing fonts["..."] call sites working unchanged
+fonts = _FontRegistry()
@@ -1,20 +1,136 @@
 from pathlib import Path
 
-from reportlab.pdfgen import canvas
+# Layout constants shared by the renderers below and by callers sizing
+# the receipt before rendering
+PAYSTUB_LINE_HEIGHT = 20
+_PAYSTUB_PADDING = 60  # 30 base margin + 10 after Date + 20 after Total Pay
 
 
-def generate_paystub_pdf(filename: Path, lines: list, receipt_size=(216, 400)):
-    """Create a simple PDF from a list of (align, text) tuples.
+# Tri-state: None until first checked, then True/False
+_reportlab_ready = None
 
-    align is 'center' or 'left'. filename is a Path instance.
+
+def ensure_reportlab() -> bool:
+    """Import reportlab once and cache whether it is available.
+
+    The first call pays the import cost (a few tenths of a second);
+    later calls are a plain comparison. Safe to run from a background
+    thread at startup to warm the import before the first report.
     """
-    c = canvas.Canvas(str(filename), pagesize=receipt_size)
-    c.setFont('Helvetica', 10)
+    global _reportlab_ready
+    if _reportlab_ready is None:
+        try:
+            import reportlab  # noqa: F401
+            _reportlab_ready = True
+        except ImportError:
+            _reportlab_ready = False
+    return _reportlab_ready
+
+
+def paystub_height(num_lines: int) -> int:
+    """Receipt height in points for a paystub with num_lines rows.
+
+    Kept beside the renderers so callers measure with the same line
+    height the canvas draws with.
+    """
+    return _PAYSTUB_PADDING + num_lines * PAYSTUB_LINE_HEIGHT
+
+
+def _draw_paystub_lines(c, lines, receipt_size):
+    """Draw one paystub's (align, text) lines on the canvas.
+
+    Contiguous runs of left-aligned lines share a single text object, so
+    one BT/ET operator pair covers the whole run instead of one per
+    drawString call. Centered lines still go through drawCentredString
+    (text objects have no centering support) and flush any open run.
+    """
+    center_x = receipt_size[0] // 2
     y = receipt_size[1] - 20
+    text_obj = None
     for align, text in lines:
+        # Callers size receipts via paystub_height, but a mis-sized page
+        # shouldn't pay stream bytes for draws below the bottom edge
+        if y < 10:
+            break
         if align == 'center':
-            c.drawCentredString(receipt_size[0] // 2, y, text)
+            if text_obj is not None:
+                c.drawText(text_obj)
+                text_obj = None
+            c.drawCentredString(center_x, y, text)
         else:
-            c.drawString(10, y, text)
-        y -= 20
+            if text_obj is None:
+                text_obj = c.beginText(10, y)
+                text_obj.setFont('Helvetica', 10)
+                text_obj.setLeading(PAYSTUB_LINE_HEIGHT)
+            text_obj.textLine(text)
+        y -= PAYSTUB_LINE_HEIGHT
+    if text_obj is not None:
+        c.drawText(text_obj)
+
+
+def generate_paystub_pdf(filename: Path, lines, receipt_size=(216, 400)):
+    """Create a simple PDF from an iterable of (align, text) tuples.
+
+    align is 'center' or 'left'. filename is a Path instance or an open
+    binary file-like object (anything with a write method); passing a
+    file object lets callers stream to memory or write atomically via a
+    temp file + os.replace. lines may be any iterable (including a
+    generator) and is consumed once.
+    """
+    # Imported lazily: this module is pulled in via the ui package at app
+    # startup, and reportlab is only needed once a report is generated
+    if not ensure_reportlab():
+        raise ImportError('reportlab is required to generate PDFs')
+    from reportlab.pdfgen import canvas
+
+    target = filename if hasattr(filename, 'write') else str(filename)
+    c = canvas.Canvas(target, pagesize=receipt_size)
+    c.setFont('Helvetica', 10)
+    _draw_paystub_lines(c, lines, receipt_size)
+    c.save()
+
+
+def generate_combined_paystub_pdf(filename: Path, paystubs: list, receipt_size=(216, 400)):
+    """Render several paystubs into one multi-page PDF with a single canvas.
+
+    paystubs is a list of line-lists as accepted by generate_paystub_pdf;
+    each paystub gets its own page via showPage(). Using one canvas
+    amortizes document/font setup across the whole batch instead of
+    paying it once per paystub. filename accepts a Path or an open
+    binary file-like object, as in generate_paystub_pdf.
+    """
+    if not ensure_reportlab():
+        raise ImportError('reportlab is required to generate PDFs')
+    from reportlab.pdfgen import canvas
+
+    target = filename if hasattr(filename, 'write') else str(filename)
+    c = canvas.Canvas(target, pagesize=receipt_size)
+    for lines in paystubs:
+        c.setFont('Helvetica', 10)
+        _draw_paystub_lines(c, lines, receipt_size)
+        c.showPage()
     c.save()
+
+
+def generate_paystub_pdfs(jobs: list):
+    """Render a batch of paystub PDFs, in parallel when the batch is large.
+
+    jobs is a list of (filename, lines, receipt_size) tuples, one per PDF.
+    Rendering is CPU-bound and each job is independent, so batches are
+    fanned out to a ProcessPoolExecutor; single jobs (the common case for
+    the current one-employee report flow) render inline to avoid pool
+    startup overhead.
+    """
+    jobs = list(jobs)
+    if len(jobs) <= 1:
+        for filename, lines, receipt_size in jobs:
+            generate_paystub_pdf(filename, lines, receipt_size)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(generate_paystub_pdf, filename, lines, receipt_size)
+                   for filename, lines, receipt_size in jobs]
+        for future in futures:
+            future.result()